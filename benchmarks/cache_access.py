@@ -0,0 +1,48 @@
+"""
+Compare the awaited `ExpiringDict` reads used by per-message listeners against the `_nowait` API
+and int-keyed namespace lookups.
+
+    python -m benchmarks.cache_access [iterations]
+    python benchmarks/cache_access.py [iterations]
+"""
+import asyncio
+import os
+import sys
+import time
+
+if not __package__:  # Run as `python benchmarks/<name>.py` rather than with `-m`.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hades.managers.cache import ExpiringDict
+
+async def main(iterations: int) -> None:
+    cache = ExpiringDict()
+    await cache.set("user_reaction:1", ["💀"], expiration=0)
+    author_id = 1
+
+    async def awaited() -> None:
+        await cache.get("user_reaction:1")
+        await cache.get("self_reaction:1")
+
+    async def gathered() -> None:
+        await asyncio.gather(cache.get("user_reaction:1"), cache.get("self_reaction:1"))
+
+    async def nowait() -> None:
+        cache.get_nowait("user_reaction:1")
+        cache.get_nowait("self_reaction:1")
+
+    async def namespaced() -> None:
+        cache.ns("user_reaction").get(author_id)
+        cache.ns("self_reaction").get(author_id)
+
+    for name, listener in (("gather", gathered), ("await", awaited), ("nowait", nowait), ("ns", namespaced)):
+        start = time.perf_counter()
+
+        for _ in range(iterations):
+            await listener()
+
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} | {elapsed / iterations * 1e9:8.1f}ns/message (2 lookups)")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000))
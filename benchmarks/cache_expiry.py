@@ -0,0 +1,73 @@
+"""
+Compare the old per-key expiration tasks against the heap-driven reaper in `ExpiringDict`.
+
+    python -m benchmarks.cache_expiry [keys]
+    python benchmarks/cache_expiry.py [keys]
+"""
+from typing import Any, Dict
+
+import asyncio
+import os
+import sys
+import time
+
+if not __package__:  # Run as `python benchmarks/<name>.py` rather than with `-m`.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hades.managers.cache import ExpiringDict
+
+class TaskPerKeyDict:
+    """
+    The previous `ExpiringDict` expiration strategy: one sleeping task per key, re-created on every write.
+    """
+
+    def __init__(self) -> None:
+        self.dict: Dict[str, Any] = {}
+        self.futures: Dict[str, asyncio.Future] = {}
+
+    async def do_expiration(self, key: str, expiration: int) -> None:
+        await asyncio.sleep(expiration)
+        self.dict.pop(key, None)
+        self.futures.pop(key, None)
+
+    async def set(self, key: str, value: Any, expiration: int = 60) -> int:
+        if key in self.futures:
+            self.futures.pop(key).cancel()
+
+        self.dict[key] = value
+        self.futures[key] = asyncio.ensure_future(self.do_expiration(key, expiration))
+        return 1
+
+async def measure(cache: Any, keys: int) -> None:
+    start = time.perf_counter()
+
+    for i in range(keys):
+        await cache.set(f"key:{i}", i, expiration=60)
+
+    fill = time.perf_counter() - start
+
+    # Rewrite every key once more, the hot path for busy accounts.
+    start = time.perf_counter()
+
+    for i in range(keys):
+        await cache.set(f"key:{i}", i, expiration=60)
+
+    rewrite = time.perf_counter() - start
+    await asyncio.sleep(0)
+
+    print(
+        f"{type(cache).__name__:<16} | tasks: {len(asyncio.all_tasks()):>7} | "
+        f"fill: {fill / keys * 1e6:6.2f}us/write | rewrite: {rewrite / keys * 1e6:6.2f}us/write"
+    )
+
+async def main(keys: int) -> None:
+    for cache in (TaskPerKeyDict(), ExpiringDict()):
+        await measure(cache, keys)
+
+        for future in getattr(cache, "futures", {}).values():
+            future.cancel()
+
+        await asyncio.sleep(0)
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,58 @@
+"""
+Measure what a filtered-out `logger.debug` call costs at the call site, with the level set to INFO:
+the old per-call `loguru_logger.level` lookups, an eager f-string, brace-style args and a callable.
+
+    python -m benchmarks.log_suppressed [iterations]
+    python benchmarks/log_suppressed.py [iterations]
+"""
+import os
+import sys
+import time
+
+if not __package__:  # Run as `python benchmarks/<name>.py` rather than with `-m`.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger as loguru_logger
+
+from hades.managers.logger import HadesLogger
+
+class Author:
+    def __init__(self, name: str, discriminator: str) -> None:
+        self.name = name
+        self.discriminator = discriminator
+
+    def __str__(self) -> str:
+        return f"{self.name}#{self.discriminator}"
+
+def main(iterations: int) -> None:
+    logger = HadesLogger(log_level="INFO")
+    author, invoked_with, error = Author("hades", "0001"), "snipe", ValueError("index out of range")
+
+    def legacy() -> None:
+        message = f"{author} ({invoked_with} - {type(error).__name__}): {error}"
+
+        if loguru_logger.level("DEBUG").no < loguru_logger.level(logger._log_level).no:
+            return
+
+    def eager() -> None:
+        logger.debug(f"{author} ({invoked_with} - {type(error).__name__}): {error}")
+
+    def braces() -> None:
+        logger.debug("{} ({} - {}): {}", author, invoked_with, type(error).__name__, error)
+
+    def deferred() -> None:
+        logger.debug(lambda: f"{author} ({invoked_with} - {type(error).__name__}): {error}")
+
+    for name, call in (("legacy", legacy), ("f-string", eager), ("braces", braces), ("callable", deferred)):
+        start = time.perf_counter()
+
+        for _ in range(iterations):
+            call()
+
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} | {elapsed / iterations * 1e9:8.1f}ns/call")
+
+    logger.shutdown()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,93 @@
+"""
+Measure the memory held per snipe entry by the old nested-dict `dump` against `MessageRecord`, with
+tracemalloc over a stream of stand-in messages (200 authors, 20 channels, one guild). Also prints what
+`sizeof` (and so `Namespace.max_bytes`) counts for each.
+
+    python -m benchmarks.message_records [messages]
+    python benchmarks/message_records.py [messages]
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+import os
+import random
+import sys
+import tracemalloc
+
+if not __package__:  # Run as `python benchmarks/<name>.py` rather than with `-m`.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hades.managers.cache import sizeof
+from hades.managers.records import MessageRecord
+
+def legacy_dump(message: Any) -> Dict[str, Any]:
+    """
+    `Hades.dump` as it was before `MessageRecord`.
+    """
+    guild, channel, author = message.guild, message.channel, message.author
+
+    return {
+        "guild": {"id": guild.id, "name": guild.name, "chunked": guild.chunked, "member_count": guild.member_count},
+        "channel": {"id": channel.id, "name": channel.name, "position": channel.position, "category_id": channel.category_id},
+        "author": {
+            "name": author.name,
+            "id": author.id,
+            "discriminator": author.discriminator,
+            "bot": author.bot,
+            "nick": author.nick,
+            "avatar": author.avatar.url,
+        },
+        "attachments": [attachment.url for attachment in message.attachments],
+        "stickers": [sticker.url for sticker in message.stickers],
+        "embeds": [embed.to_dict() for embed in message.embeds],
+        "content": message.content,
+        "timestamp": datetime.utcfromtimestamp(message.created_at.timestamp()),
+        "id": message.id,
+    }
+
+def stream(count: int) -> List[SimpleNamespace]:
+    guild = SimpleNamespace(id=1, name="guild", chunked=True, member_count=5000)
+    channels = [SimpleNamespace(id=100 + i, name=f"channel-{i}", position=i, category_id=None) for i in range(20)]
+    authors = [
+        SimpleNamespace(
+            id=1000 + i, name=f"user{i}", discriminator="0", bot=False, nick=None,
+            avatar=SimpleNamespace(key=f"{i:032x}", url=f"https://cdn.discordapp.com/avatars/{1000 + i}/{i:032x}.png"),
+        )
+        for i in range(200)
+    ]
+
+    return [
+        SimpleNamespace(
+            id=10**17 + i,
+            content="".join(random.choices("abcdefghij ", k=random.randint(5, 120))),
+            created_at=datetime.now(),
+            author=random.choice(authors),
+            guild=guild,
+            channel=random.choice(channels),
+            attachments=[],
+            stickers=[],
+            embeds=[],
+        )
+        for i in range(count)
+    ]
+
+def measure(dump: Callable[[Any], Any], messages: List[SimpleNamespace]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [dump(message) for message in messages]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del kept
+    return (after - before) / len(messages)
+
+def main(count: int) -> None:
+    messages = stream(count)
+
+    for name, dump in (("dump dict", legacy_dump), ("MessageRecord", MessageRecord.from_message)):
+        sized = sum(sizeof(dump(message)) for message in messages[:1000]) / min(count, 1000)
+        print(f"{name:<14} | {measure(dump, messages):7.0f} bytes/entry (traced) | {sized:7.0f} bytes/entry (sizeof)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
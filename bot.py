@@ -1,9 +1,18 @@
+from hades.managers.startup import trace
+import sys
+
+trace.install(sys.argv)
+
 from hades.managers.updater import Updater
+from hades.managers.config import ConfigManager
 from hades.hades import Hades
 import json
 
-config = json.load(open("config.json", "r"))
+trace.mark("imports")
+
+config = ConfigManager()
 update = json.load(open("update.json", "r"))
 
-Updater(current_version=update["version"]).run()
-Hades().run(token=config["token"])
+trace.mark("config")
+
+Hades(config=config, updater=Updater(current_version=update["version"])).run(token=config.current.token)
@@ -1,5 +1,7 @@
 from typing import Union, List
+import compileall
 import os
+import sys
 
 def clear_pycache() -> None:
     """
@@ -31,4 +33,14 @@ def clear_pycache() -> None:
     except Exception as e:
         print(f"Error: {e}")
 
-clear_pycache()
+def compile_pycache() -> None:
+    """
+    Precompile bytecode so the next start skips compiling, instead of wiping it.
+    """
+
+    ok: bool = compileall.compile_dir("hades", quiet=1, workers=0)
+    ok &= all(compileall.compile_file(path, quiet=1) for path in ("bot.py", "clear.py"))
+
+    print("Compilation completed." if ok else "Compilation finished with errors.")
+
+compile_pycache() if "--compile" in sys.argv else clear_pycache()
@@ -1 +1,177 @@
-# no
+"""
+A small self-hosted embed server, so `get_embed` can mint links without a third-party service.
+
+Serves an OpenGraph page for every embed at `/e/{code}` and an oEmbed endpoint at `/oembed?url=...`.
+Run `python -m hades.api.start --check` to start it locally and fetch a freshly minted embed through
+a stand-in client.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+
+from aiohttp import web, ClientSession
+
+import asyncio
+import hashlib
+import html
+import json
+import sys
+
+from ..managers.embed import EmbedCache, client
+
+__all__: Tuple[str, ...] = ("EmbedStore", "EmbedServer")
+
+class EmbedStore:
+    """
+    Locally created embeds, content-addressed by code. Rows live in the `local` table of the embed cache's
+    SQLite file, sharing its connection and lock; reads and writes run off the event loop, and only the
+    `size` most recently used embeds are kept in memory.
+    """
+
+    def __init__(self, cache: Optional[EmbedCache] = None, size: int = 512) -> None:
+        self.cache: EmbedCache = cache or client.cache
+        self.size: int = size
+        self.embeds: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def run(self, query: str, params: Tuple[Any, ...] = (), commit: bool = False) -> List[Tuple[Any, ...]]:
+        return await asyncio.to_thread(self.cache.execute, query, params, commit)
+
+    async def open(self) -> None:
+        await self.run("CREATE TABLE IF NOT EXISTS local (code TEXT PRIMARY KEY, data TEXT)", commit=True)
+
+    def remember(self, code: str, data: Dict[str, Any]) -> None:
+        self.embeds[code] = data
+        self.embeds.move_to_end(code)
+
+        while len(self.embeds) > self.size:
+            self.embeds.popitem(last=False)
+
+    async def add(self, data: Dict[str, Any]) -> str:
+        serialized: str = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        code: str = hashlib.sha256(serialized.encode()).hexdigest()[:12]
+
+        if code not in self.embeds:
+            await self.run("INSERT OR IGNORE INTO local VALUES (?, ?)", (code, serialized), commit=True)
+            self.remember(code, data)
+
+        return code
+
+    async def get(self, code: str) -> Optional[Dict[str, Any]]:
+        if (data := self.embeds.get(code)) is not None:
+            self.embeds.move_to_end(code)
+            return data
+
+        if not (rows := await self.run("SELECT data FROM local WHERE code = ?", (code,))):
+            return None
+
+        self.remember(code, data := json.loads(rows[0][0]))
+        return data
+
+class EmbedServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        public_url: Optional[str] = None,
+        store: Optional[EmbedStore] = None
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.public_url: str = (public_url or f"http://{host}:{port}").rstrip("/")
+        self.store: EmbedStore = store or EmbedStore()
+
+        self.app: web.Application = web.Application()
+        self.app.router.add_get("/e/{code}", self.page)
+        self.app.router.add_get("/oembed", self.oembed)
+
+        self.runner: Optional[web.AppRunner] = None
+
+    async def mint(self, payload: Dict[str, Any]) -> str:
+        """
+        Store a `build_payload` payload and return its public link; used as `EmbedClient.local`.
+        """
+        return f"{self.public_url}/e/{await self.store.add(payload['0']['json'])}"
+
+    async def start(self) -> None:
+        await self.store.open()
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+
+    async def stop(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def page(self, request: web.Request) -> web.Response:
+        code: str = request.match_info["code"]
+
+        if (data := await self.store.get(code)) is None:
+            raise web.HTTPNotFound()
+
+        meta: Dict[str, Optional[str]] = {
+            "og:site_name": data.get("provider"),
+            "og:title": data.get("title"),
+            "og:description": data.get("description"),
+            "theme-color": data.get("color"),
+            "og:image": data.get("mediaSource") if data.get("mediaType") == "thumbnail" else None,
+            "og:video": data.get("mediaSource") if data.get("mediaType") == "video" else None,
+        }
+        tags: str = "\n".join(
+            f'<meta {"name" if key == "theme-color" else "property"}="{key}" content="{html.escape(value)}">'
+            for key, value in meta.items()
+            if value
+        )
+        oembed: str = html.escape(f"{self.public_url}/oembed?url={self.public_url}/e/{code}")
+
+        return web.Response(
+            text=(
+                "<!DOCTYPE html><html><head>"
+                f"{tags}\n"
+                f'<link rel="alternate" type="application/json+oembed" href="{oembed}">'
+                "</head><body></body></html>"
+            ),
+            content_type="text/html",
+        )
+
+    async def oembed(self, request: web.Request) -> web.Response:
+        code: str = request.query.get("url", "").rstrip("/").rsplit("/", 1)[-1]
+
+        if (data := await self.store.get(code)) is None:
+            raise web.HTTPNotFound()
+
+        return web.json_response({
+            key: value
+            for key, value in {
+                "version": "1.0",
+                "type": "link",
+                "provider_name": data.get("provider"),
+                "provider_url": data.get("providerLink"),
+                "author_name": data.get("author"),
+                "author_url": data.get("authorLink"),
+                "title": data.get("title"),
+            }.items()
+            if value is not None
+        })
+
+async def main(check: bool = False) -> None:
+    server = EmbedServer()
+    await server.start()
+    print(f"[HADES API] Serving embeds on {server.public_url}")
+
+    if not check:
+        await asyncio.Event().wait()
+
+    url: str = await server.mint({"0": {"json": {"title": "Hades Self-Bot", "description": "✅ » It works.", "color": "#00ff00", "author": "Hades"}}})
+
+    async with ClientSession() as client:
+        async with client.get(url) as response:
+            print(f"[HADES API] GET {url} -> {response.status}\n{await response.text()}")
+
+        async with client.get(f"{server.public_url}/oembed", params={"url": url}) as response:
+            print(f"[HADES API] GET oembed -> {response.status} {await response.json()}")
+
+    await server.stop()
+
+if __name__ == "__main__":
+    asyncio.run(main(check="--check" in sys.argv))
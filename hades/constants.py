@@ -1,9 +1,11 @@
 from typing import Dict, List, Any, TypedDict
 
 from discord import HypeSquadHouse
-import requests
+import asyncio
 import re
 
+from .managers.http import client as http
+
 HYPESQUAD: Dict[str, Any] = {
     "balance": HypeSquadHouse.balance,
     "bravery": HypeSquadHouse.bravery,
@@ -16,7 +18,25 @@ HEADERS: Dict[str, str] = {
 
 NITRO_REGEX: re.Pattern = re.compile(r"(discord.com/gifts/|discordapp.com/gifts/|discord.gift/)([a-zA-Z0-9]+)")
 PRIVNOTE_REGEX: re.Pattern = re.compile(r"https://privnote\.com/[a-zA-Z0-9]+#[a-zA-Z0-9]+")
-PACKS: List[str] = list(set(
-    requests.get("https://raw.githubusercontent.com/nullsx/PACK-BIBLE-S2/main/Another_BKC_Pack_Bible.txt").text.strip().split("\n\n") +
-    requests.get("https://raw.githubusercontent.com/nullsx/PACK-BIBLE-S2/main/Huge_Pack_Bible.txt").text.strip().split("\n\n")
-))
+PACK_URLS: List[str] = [
+    "https://raw.githubusercontent.com/nullsx/PACK-BIBLE-S2/main/Another_BKC_Pack_Bible.txt",
+    "https://raw.githubusercontent.com/nullsx/PACK-BIBLE-S2/main/Huge_Pack_Bible.txt",
+]
+PACKS: List[str] = []
+PACKS_LOCK: asyncio.Lock = asyncio.Lock()
+
+async def packs() -> List[str]:
+    """
+    The pack bibles, downloaded on first use rather than at import. Concurrent first callers share one
+    download, and nothing is cached unless every request succeeded.
+    """
+    async with PACKS_LOCK:
+        if not PACKS:
+            responses = await asyncio.gather(*(http.get(url) for url in PACK_URLS))
+
+            for response in responses:
+                response.raise_for_status()
+
+            PACKS.extend(set(pack for response in responses for pack in response.text.strip().split("\n\n")))
+
+    return PACKS
@@ -0,0 +1,246 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple
+
+from discord import Message
+from discord.ext.commands import group, Cog
+
+from ..managers.context import HadesContext, Flags
+from ..hades import Hades
+
+from datetime import datetime
+from pathlib import Path
+
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+
+PROFILES: Path = Path("profiles")
+
+def stamp(kind: str, suffix: str) -> Path:
+    PROFILES.mkdir(exist_ok=True)
+    return PROFILES / f"{kind}-{datetime.now():%Y%m%d-%H%M%S}.{suffix}"
+
+def short(path: str) -> str:
+    try:
+        relative = os.path.relpath(path)
+    except ValueError:
+        return path
+
+    return path if relative.startswith("..") else relative
+
+def codeblock(lines: List[str], limit: int = 1900) -> str:
+    text, size = [], 0
+
+    for line in lines:
+        if size + len(line) + 1 > limit:
+            break
+
+        text.append(line)
+        size += len(line) + 1
+
+    return "```go\n" + "\n".join(text) + "```"
+
+class Developer(Cog):
+    """
+    On-demand profiling of the running bot: a `cProfile` session for CPU and `tracemalloc` snapshots for memory.
+    Full reports go to `profiles/`, a summary goes to chat.
+    """
+
+    def __init__(self, bot: Hades) -> None:
+        self.bot: Hades = bot
+        self.profiler: Optional[cProfile.Profile] = None
+        self.profile_started: Optional[datetime] = None
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+
+    async def cog_check(self, ctx: HadesContext) -> bool:
+        return ctx.author.id == self.bot.user.id
+
+    async def cog_unload(self) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @group(
+        name="profiler",
+        aliases=["prof"],
+        description="Profile CPU time spent on the event loop.",
+        usage="[start/stop]",
+        invoke_without_command=True
+    )
+    async def profiler_group(self, ctx: HadesContext) -> None:
+        if ctx.invoked_subcommand is None:
+            await ctx.do(
+                _type=Flags.WARN,
+                content=f"Invalid profiler command passed... - `{ctx.prefix}profiler start/stop`",
+                embed=self.bot.embed
+            )
+
+    @profiler_group.command(
+        name="start",
+        description="Start a cProfile session."
+    )
+    async def profiler_start(self, ctx: HadesContext) -> Message:
+        await ctx.delete()
+
+        if self.profiler is not None:
+            return await ctx.do(_type=Flags.WARN, content="A profiling session is already running!", embed=self.bot.embed)
+
+        self.profiler, self.profile_started = cProfile.Profile(), datetime.now()
+        self.profiler.enable()
+
+        return await ctx.do(_type=Flags.APPROVE, emoji="✅", content="Profiling started.", embed=self.bot.embed)
+
+    @profiler_group.command(
+        name="stop",
+        description="Stop profiling, save the report and show the top functions.",
+        usage="[limit]",
+        example="15"
+    )
+    async def profiler_stop(self, ctx: HadesContext, limit: int = 10) -> Message:
+        await ctx.delete()
+
+        if self.profiler is None:
+            return await ctx.do(_type=Flags.WARN, content="No profiling session is running!", embed=self.bot.embed)
+
+        profiler, self.profiler = self.profiler, None
+        profiler.disable()
+        elapsed = (datetime.now() - self.profile_started).total_seconds()
+
+        path, rows = await asyncio.to_thread(self.write_profile, profiler, limit)
+        self.bot.logger.info("Saved a {:.1f}s CPU profile to {}.", elapsed, path)
+
+        return await ctx.send(
+            codeblock([f"CPU profile · {elapsed:.1f}s · {path}", "", f"{'calls':>8} {'cum s':>8} {'own s':>8}  function", *rows]),
+            delete_after=60
+        )
+
+    @staticmethod
+    def write_profile(profiler: cProfile.Profile, limit: int) -> Tuple[Path, List[str]]:
+        path = stamp("cpu", "prof")
+        profiler.dump_stats(path)
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(100)
+        path.with_suffix(".txt").write_text(stream.getvalue())
+
+        rows: List[str] = []
+
+        for (filename, line, name), (_, calls, own, cumulative, _) in sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[:limit]:
+            where = f"{short(filename)}:{line}" if line else filename
+            rows.append(f"{calls:>8} {cumulative:>8.3f} {own:>8.3f}  {name} ({where})")
+
+        return path, rows
+
+    @group(
+        name="memory",
+        aliases=["mem"],
+        description="Trace memory allocations.",
+        usage="[start/snapshot/stop]",
+        invoke_without_command=True
+    )
+    async def memory_group(self, ctx: HadesContext) -> None:
+        if ctx.invoked_subcommand is None:
+            await ctx.do(
+                _type=Flags.WARN,
+                content=f"Invalid memory command passed... - `{ctx.prefix}memory start/snapshot/stop`",
+                embed=self.bot.embed
+            )
+
+    @memory_group.command(
+        name="start",
+        description="Start tracing allocations and take a baseline snapshot.",
+        usage="[frames]",
+        example="5"
+    )
+    async def memory_start(self, ctx: HadesContext, frames: int = 1) -> Message:
+        await ctx.delete()
+
+        if tracemalloc.is_tracing():
+            return await ctx.do(_type=Flags.WARN, content="Memory tracing is already running!", embed=self.bot.embed)
+
+        tracemalloc.start(frames)
+        self.baseline = tracemalloc.take_snapshot()
+
+        return await ctx.do(_type=Flags.APPROVE, emoji="✅", content="Memory tracing started.", embed=self.bot.embed)
+
+    @memory_group.command(
+        name="snapshot",
+        aliases=["diff"],
+        description="Save a snapshot and show the top allocation sites, and the growth since the last one.",
+        usage="[limit]",
+        example="15"
+    )
+    async def memory_snapshot(self, ctx: HadesContext, limit: int = 10) -> Message:
+        await ctx.delete()
+
+        if not tracemalloc.is_tracing():
+            return await ctx.do(_type=Flags.WARN, content=f"Memory tracing is off. - `{ctx.prefix}memory start`", embed=self.bot.embed)
+
+        snapshot = tracemalloc.take_snapshot()
+        baseline, self.baseline = self.baseline, snapshot
+
+        path, lines = await asyncio.to_thread(self.write_snapshot, snapshot, baseline, limit)
+        self.bot.logger.info("Saved a memory snapshot to {}.", path)
+
+        return await ctx.send(codeblock([f"Memory snapshot · {path}", "", *lines]), delete_after=60)
+
+    @staticmethod
+    def write_snapshot(
+        snapshot: tracemalloc.Snapshot,
+        baseline: Optional[tracemalloc.Snapshot],
+        limit: int
+    ) -> Tuple[Path, List[str]]:
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        path = stamp("memory", "txt")
+
+        by_file = snapshot.statistics("filename")
+        by_line = snapshot.statistics("lineno")
+        growth = snapshot.compare_to(baseline, "lineno") if baseline is not None else []
+
+        def site(stat: tracemalloc.Statistic) -> str:
+            frame = stat.traceback[0]
+            return f"{short(frame.filename)}:{frame.lineno}"
+
+        report: List[str] = [f"traced {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB", "", "-- by file --"]
+        report += [f"{stat.size / 1024:>10.1f} KiB {stat.count:>8}  {short(stat.traceback[0].filename)}" for stat in by_file[:50]]
+        report += ["", "-- by line --"]
+        report += [f"{stat.size / 1024:>10.1f} KiB {stat.count:>8}  {site(stat)}" for stat in by_line[:50]]
+        report += ["", "-- growth since the last snapshot --"]
+        report += [f"{stat.size_diff / 1024:>+10.1f} KiB {stat.count_diff:>+8}  {site(stat)}" for stat in growth[:50]]
+        path.write_text("\n".join(report))
+
+        lines: List[str] = [f"traced {current / 1024:.1f} KiB · peak {peak / 1024:.1f} KiB", "", "top files:"]
+        lines += [f"{stat.size / 1024:>9.1f} KiB  {short(stat.traceback[0].filename)}" for stat in by_file[:limit]]
+        lines += ["", "top lines:"]
+        lines += [f"{stat.size / 1024:>9.1f} KiB  {site(stat)}" for stat in by_line[:limit]]
+
+        if growth:
+            lines += ["", "growth:"]
+            lines += [f"{stat.size_diff / 1024:>+9.1f} KiB  {site(stat)}" for stat in growth[:limit]]
+
+        return path, lines
+
+    @memory_group.command(
+        name="stop",
+        description="Stop tracing allocations."
+    )
+    async def memory_stop(self, ctx: HadesContext) -> None:
+        tracemalloc.stop()
+        self.baseline = None
+        await ctx.message.add_reaction("👍")
+
+async def setup(bot: Hades) -> None:
+    await bot.add_cog(Developer(bot))
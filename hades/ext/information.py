@@ -21,7 +21,8 @@ from discord.ext.commands import group, command, Cog, Command, Group
 import discord
 
 from ..managers.context import HadesContext, Flags, FlagsEmojiMapping
-from ..managers.embed import Embed
+from ..managers.embed import Embed, client as embed_client
+from ..managers.http import client as http
 from ..hades import Hades
 
 import asyncio
@@ -103,7 +104,7 @@ class Information(Cog):
         ctx: HadesContext, 
         user: Union[Member, User] = None
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
         
         user = user or ctx.author
         avatar_url = user.avatar.url if user.avatar else user.default_avatar.url
@@ -112,5 +113,65 @@ class Information(Cog):
             f"{user.mention}'s avatar: {avatar_url}"
         ) if avatar_url else await ctx.send(f"{user.mention} has no avatar!")
 
+    @group(
+        name="stats",
+        description="Show latency percentiles per command, listener and rule.",
+        usage="[on/off/reset]",
+        invoke_without_command=True
+    )
+    async def stats(self, ctx: HadesContext) -> Message:
+        await ctx.delete()
+
+        if not self.bot.metrics.enabled and not self.bot.metrics.histograms:
+            return await ctx.do(
+                _type=Flags.WARN,
+                content=f"Latency stats are off. - `{ctx.prefix}stats on`",
+                embed=self.bot.embed
+            )
+
+        self.bot.log_metrics()
+
+        rows: List[str] = [
+            f"{key[:28]:<28} {summary['count']:>6} {summary['p50']:>8.1f} {summary['p95']:>8.1f} {summary['p99']:>8.1f}"
+            for key, summary in self.bot.metrics.summary()[:15]
+        ]
+        log, embeds, requests = self.bot.logger.stats, embed_client.cache.stats, http.stats
+
+        return await ctx.send(
+            "```go\n"
+            f"{'name':<28} {'n':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}\n"
+            + "\n".join(rows or ["No samples yet."])
+            + f"\n\nlogger: {log['emitted']} emitted, {log['dropped']} dropped, {log['queued']} queued"
+            f"\nembeds: {embeds['hits']} hits, {embeds['disk_hits']} disk, {embeds['misses']} misses"
+            f"\nhttp: {requests['requests']} requests, {requests['errors']} errors, {requests['hosts']} hosts"
+            f"\ncache: {sum(ns['entries'] for ns in self.bot.cache.stats().values())} entries"
+            "```",
+            delete_after=30
+        )
+
+    @stats.command(
+        name="on",
+        description="Start recording latencies."
+    )
+    async def stats_on(self, ctx: HadesContext) -> None:
+        self.bot.metrics.enabled = True
+        await ctx.message.add_reaction("👍")
+
+    @stats.command(
+        name="off",
+        description="Stop recording latencies, keeping what was recorded."
+    )
+    async def stats_off(self, ctx: HadesContext) -> None:
+        self.bot.metrics.enabled = False
+        await ctx.message.add_reaction("👍")
+
+    @stats.command(
+        name="reset",
+        description="Clear the recorded latencies."
+    )
+    async def stats_reset(self, ctx: HadesContext) -> None:
+        self.bot.metrics.reset()
+        await ctx.message.add_reaction("👍")
+
 async def setup(bot: Hades) -> None:
     await bot.add_cog(Information(bot))
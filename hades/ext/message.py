@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Dict, List, Literal, Optional
-from pydantic import BaseModel, HttpUrl
 
 from discord import (
     User,
@@ -19,7 +18,6 @@ from ..managers.context import HadesContext, Flags
 from ..managers.embed import Embed
 from ..hades import Hades
 
-from xxhash import xxh32_hexdigest
 import datetime
 import asyncio
 
@@ -27,16 +25,37 @@ class Messages(Cog):
     def __init__(self, bot: Hades) -> None:
         self.bot: Hades = bot
 
+    async def cog_load(self) -> None:
+        self.bot.router.register(
+            "auto_reply",
+            self.check_reply,
+            always=len(self.bot.cache.ns("auto_reply")) > 0,
+            match=self.wants_reply
+        )
+        self.bot.router.register(
+            "react",
+            self.check_react,
+            authors={*self.bot.cache.ns("user_reaction"), *self.bot.cache.ns("self_reaction")}
+        )
+
+    async def cog_unload(self) -> None:
+        for name in ("auto_reply", "react"):
+            self.bot.router.unregister(name)
+
+    def sync_react(self, user_id: int) -> None:
+        watched = user_id in self.bot.cache.ns("user_reaction") or user_id in self.bot.cache.ns("self_reaction")
+        (self.bot.router.watch if watched else self.bot.router.unwatch)("react", author=user_id)
+
     @Cog.listener("on_message_delete")
     async def deletes(self: Messages, message: Message) -> None:
         if not message.author.bot and message.author != self.bot.user:
             try:
-                await self.bot.cache.sadd(
-                    f"snipe:{xxh32_hexdigest(str(message.channel.id))}",
+                self.bot.cache.ns("snipe").lpush(
+                    message.channel.id,
                     self.bot.dump(message),
                 )
             except Exception as e:
-                self.bot.logger.error(e)
+                self.bot.logger.error("{}", e)
 
     @Cog.listener("on_message_edit")
     async def edits(
@@ -46,44 +65,42 @@ class Messages(Cog):
     ) -> None:
         if not after.author.bot and after.author != self.bot.user:
             try:
-                await self.bot.cache.sadd(
-                    f"editsnipe:{xxh32_hexdigest(str(after.channel.id))}",
-                    [self.bot.dump(before), self.bot.dump(after)],
+                self.bot.cache.ns("editsnipe").lpush(
+                    after.channel.id,
+                    (self.bot.dump(before), self.bot.dump(after)),
                 )
             except Exception as e:
-                self.bot.logger.error(e)
+                self.bot.logger.error("{}", e)
+
+    def wants_reply(self: Messages, origin: Message) -> bool:
+        return not origin.author.bot and (origin.reference is not None or self.bot.user.mentioned_in(origin))
 
-    @Cog.listener("on_message")
     async def check_reply(self: Messages, origin: Message) -> None:
         if origin.author.bot:
             return
 
-        reply = await self.bot.cache.get(f"auto_reply:{xxh32_hexdigest(str(self.bot.user.id))}")
+        reply = self.bot.cache.ns("auto_reply").get(self.bot.user.id)
 
         if reply and (ref := origin.reference) and (resolved := ref.resolved) and isinstance(resolved, Message):
             if resolved.author == self.bot.user and origin.author != self.bot.user:
-                await origin.reply(reply[0])
+                await origin.reply(reply)
         
         if reply and self.bot.user.mentioned_in(origin) and origin.reference is None:
-            await origin.reply(reply[0])
+            await origin.reply(reply)
 
-    @Cog.listener("on_message")
     async def check_react(self: Messages, origin: Message) -> None:
         if origin.author.bot:
             return
 
-        hashed = xxh32_hexdigest(str(origin.author.id))
-        user, _self = await asyncio.gather(
-            self.bot.cache.get(f"user_reaction:{hashed}"),
-            self.bot.cache.get(f"self_reaction:{hashed}")
-        )
+        user = self.bot.cache.ns("user_reaction").get(origin.author.id)
+        _self = self.bot.cache.ns("self_reaction").get(origin.author.id)
 
         if _self:
-            await origin.add_reaction(_self[0])
+            await origin.add_reaction(_self)
 
         if user:
             try:
-                await origin.add_reaction(user[0])
+                await origin.add_reaction(user)
             except errors.Forbidden as e:
                 if "Reaction blocked" in str(e):
                     print(
@@ -106,23 +123,19 @@ class Messages(Cog):
         ctx: HadesContext,
         index: int = 1
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        snipes = await self.bot.cache.get(f"editsnipe:{xxh32_hexdigest(str(ctx.channel.id))}")
+        snipes = self.bot.cache.ns("editsnipe").get(ctx.channel.id)
         
         if not snipes or index <= 0 or index > len(snipes):
-            return await ctx.do(
-                _type=Flags.WARN,
-                emoji="❌",
-                content="There are no edited messages to snipe."
-            )
+            return await ctx.respond("no_editsnipes")
         
-        before, after = snipes[0][0], snipes[0][1]
+        before, after = snipes[index - 1]
         
         return await ctx.send(
             content=(
-                f"Sniped edited content from **{before['author']['name']}** - {discord.utils.format_dt(after['timestamp'])}:\n\n"
-                f"```\nBefore -> {before['content']}\nAfter -> {after['content']}```\n\n"
+                f"Sniped edited content from **{before.author.name}** - {discord.utils.format_dt(after.timestamp)}:\n\n"
+                f"```\nBefore -> {before.content}\nAfter -> {after.content}```\n\n"
                 f"{index}/{len(snipes)} messages sniped.\n"
             ).strip(),
             delete_after=5
@@ -140,23 +153,19 @@ class Messages(Cog):
         ctx: HadesContext,
         index: int = 1
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        snipes = await self.bot.cache.get(f"snipe:{xxh32_hexdigest(str(ctx.channel.id))}")
+        snipes = self.bot.cache.ns("snipe").get(ctx.channel.id)
         
         if not snipes or index <= 0 or index > len(snipes):
-            return await ctx.do(
-                _type=Flags.WARN,
-                emoji="❌",
-                content="There are no deleted messages to snipe."
-            )
+            return await ctx.respond("no_snipes")
         
         message = snipes[index - 1]
         
         return await ctx.send(
             content=(
-                f"Sniped content from **{message['author']['name']}** - {discord.utils.format_dt(message['timestamp'])}:\n\n"
-                f"```\n{message['content']}```\n\n"
+                f"Sniped content from **{message.author.name}** - {discord.utils.format_dt(message.timestamp)}:\n\n"
+                f"```\n{message.content}```\n\n"
                 f"{index}/{len(snipes)} messages sniped.\n"
             ).strip(),
             delete_after=5
@@ -165,14 +174,16 @@ class Messages(Cog):
     @command(
         name="clearsnipes",
         aliases=["cs"],
-        description="Clear the snipes of edited & deleted messages."
+        description="Clear the snipes of edited & deleted messages.",
+        usage="[all]",
+        example="all"
     )
-    async def clearsnipes(self: Messages, ctx: HadesContext) -> Message:
-        for query in [
-            f"snipe:{xxh32_hexdigest(str(ctx.channel.id))}",
-            f"editsnipe:{xxh32_hexdigest(str(ctx.channel.id))}"
-        ]:
-            await self.bot.cache.remove(query)
+    async def clearsnipes(self: Messages, ctx: HadesContext, scope: Optional[str] = None) -> Message:
+        for namespace in ("snipe", "editsnipe"):
+            if scope == "all":
+                self.bot.cache.delete_prefix(f"{namespace}:")
+            else:
+                self.bot.cache.ns(namespace).pop(ctx.channel.id)
 
         return await ctx.message.add_reaction("👍")
 
@@ -188,9 +199,10 @@ class Messages(Cog):
         *,
         message: Optional[str] = None
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        check: str = "off" if await self.bot.cache.get(f"auto_reply:{xxh32_hexdigest(str(ctx.author.id))}") else "on"
+        auto_reply = self.bot.cache.ns("auto_reply")
+        check: str = "off" if auto_reply.get(ctx.author.id) else "on"
 
         if not message and check != "off":
             return await ctx.do(
@@ -199,18 +211,20 @@ class Messages(Cog):
                 content="Hey! You need a `message` as well!"
             )
 
-        await self.bot.cache.sadd(
-            f"auto_reply:{xxh32_hexdigest(str(ctx.author.id))}",
-            message
-        )
+        auto_reply.put(ctx.author.id, message)
 
         if check == "off":
-            await self.bot.cache.remove(f"auto_reply:{xxh32_hexdigest(str(ctx.author.id))}")
+            auto_reply.pop(ctx.author.id)
+
+        self.bot.router.toggle("auto_reply", check == "on")
+
+        if check == "off":
+            return await ctx.respond("auto_reply_off", embed=self.bot.embed)
 
         return await ctx.do(
             _type=Flags.APPROVE,
             emoji="✅",
-            content=f"Auto-reply has been turned **{check}** with `{message}` as the message." if check == "on" else f"Auto-reply has been turned **{check}**.",
+            content=f"Auto-reply has been turned **on** with `{message}` as the message.",
             embed=self.bot.embed
         )
 
@@ -225,24 +239,19 @@ class Messages(Cog):
         ctx: HadesContext,
         reaction: Optional[str | Emoji | PartialEmoji] = None
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        check: str = "off" if await self.bot.cache.get(f"self_reaction:{xxh32_hexdigest(str(ctx.author.id))}") else "on"
+        self_reaction = self.bot.cache.ns("self_reaction")
+        check: str = "off" if self_reaction.get(ctx.author.id) else "on"
 
-        await self.bot.cache.sadd(
-            f"self_reaction:{xxh32_hexdigest(str(ctx.author.id))}",
-            reaction
-        )
+        self_reaction.put(ctx.author.id, reaction)
 
         if check == "off":
-            await self.bot.cache.remove(f"self_reaction:{xxh32_hexdigest(str(ctx.author.id))}")
+            self_reaction.pop(ctx.author.id)
 
-        return await ctx.do(
-            _type=Flags.APPROVE,
-            emoji="✅",
-            content=f"Auto-react has been turned **{check}**.",
-            embed=self.bot.embed
-        )
+        self.sync_react(ctx.author.id)
+
+        return await ctx.respond(f"auto_react_{check}", embed=self.bot.embed)
 
     @command(
         name="autoreact",
@@ -256,17 +265,17 @@ class Messages(Cog):
         user: User,
         reaction: Optional[str | Emoji | PartialEmoji] = None
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        check: str = "off" if await self.bot.cache.get(f"user_reaction:{xxh32_hexdigest(str(user.id))}") else "on"
+        user_reaction = self.bot.cache.ns("user_reaction")
+        check: str = "off" if user_reaction.get(user.id) else "on"
 
-        await self.bot.cache.sadd(
-            f"user_reaction:{xxh32_hexdigest(str(user.id))}",
-            reaction
-        )
+        user_reaction.put(user.id, reaction)
 
         if check == "off":
-            await self.bot.cache.remove(f"user_reaction:{xxh32_hexdigest(str(user.id))}")
+            user_reaction.pop(user.id)
+
+        self.sync_react(user.id)
 
         return await ctx.do(
             _type=Flags.APPROVE,
@@ -287,7 +296,7 @@ class Messages(Cog):
         amount: Optional[int] = 100,
         location: Optional[TextChannel | DMChannel | int] = None,
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
         channel: TextChannel | DMChannel = ctx.channel if location is None else await self.bot.fetch_channel(location)
         
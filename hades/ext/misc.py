@@ -23,12 +23,11 @@ from discord.ext.commands import group, command, Cog
 from discord.errors import CaptchaRequired
 import discord
 
-from ..managers.context import HadesContext, Flags, FlagsEmojiMapping
+from ..managers.context import HadesContext, Flags, FlagsEmojiMapping, cooldown
 from ..managers.embed import Embed
-from ..constants import PACKS
+from ..constants import packs
 from ..hades import Hades
 
-from xxhash import xxh32_hexdigest
 import asyncio
 import random
 
@@ -58,24 +57,27 @@ class Miscellaneous(Cog):
         self.afk_guild: Optional[Guild] = None
         self.afk_channel: Optional[VoiceChannel] = None
 
-    @Cog.listener("on_message")
+    async def cog_load(self) -> None:
+        self.bot.router.register("insult", self.check_insult, authors=self.bot.cache.ns("insult"))
+        self.bot.router.register("outlast", self.check_outlast, authors=self.bot.cache.ns("outlast"))
+
+    async def cog_unload(self) -> None:
+        for name in ("insult", "outlast"):
+            self.bot.router.unregister(name)
+
     async def check_insult(self, origin: Message) -> None:
-        if await self.bot.cache.get(
-            f"insult:{xxh32_hexdigest(str(origin.author.id))}"
-        ):
+        if self.bot.cache.ns("insult").get(origin.author.id):
             await origin.reply(
-                "# " + random.choice(PACKS)
+                "# " + random.choice(await packs())
             )
 
-    @Cog.listener("on_message")
     async def check_outlast(self, origin: Message) -> None:
-        key = f"outlast:{xxh32_hexdigest(str(origin.author.id))}"
-
-        if await self.bot.cache.get(key):
-            count = await self.bot.cache.get(f"{key}:count") or 0
+        if self.bot.cache.ns("outlast").get(origin.author.id):
+            counts = self.bot.cache.ns("outlast_count")
+            count = counts.get(origin.author.id) or 0
             count += 1
 
-            await self.bot.cache.set(f"{key}:count", count)
+            counts.put(origin.author.id, count, expiration=60)
             await origin.reply(f"you're ass at outlasting {count}")
 
     @command(
@@ -84,8 +86,9 @@ class Miscellaneous(Cog):
         usage="[timeout]",
         example="30"
     )
+    @cooldown(1, 60)
     async def massadd(self, ctx: HadesContext, timeout: int = 30) -> None:
-        await ctx.message.delete()
+        await ctx.delete()
 
         users: List[User | Member] = []
         
@@ -100,7 +103,7 @@ class Miscellaneous(Cog):
         tasks = [scrape_guild(guild) for guild in self.bot.guilds]
         await asyncio.gather(*tasks)
 
-        self.bot.logger.info(f"Scraped {len(users)} users across all guilds.")
+        self.bot.logger.info("Scraped {} users across all guilds.", len(users))
 
         await ctx.do(
             _type=Flags.APPROVE,
@@ -117,11 +120,11 @@ class Miscellaneous(Cog):
 
             try:
                 await user.send_friend_request()
-                self.bot.logger.info(f"Sent friend request to {user.name}")
+                self.bot.logger.info("Sent friend request to {}", user.name)
             except Forbidden:
-                self.bot.logger.error(f"Failed to send friend request to {user.name} (Forbidden)")
+                self.bot.logger.error("Failed to send friend request to {} (Forbidden)", user.name)
             except Exception as e:
-                self.bot.logger.error(f"Failed to send friend request to {user.name}: {e}")
+                self.bot.logger.error("Failed to send friend request to {}: {}", user.name, e)
 
             await asyncio.sleep(timeout)
             
@@ -131,12 +134,13 @@ class Miscellaneous(Cog):
         usage="(sentence)"
     )
     async def type(self, ctx: HadesContext, *, sentence: str) -> None:
-        await ctx.message.delete()
+        await ctx.delete()
 
         words: List[str] = sentence.split()
         channel: DMChannel | TextChannel = ctx.channel
 
         for word in words:
+            await self.bot.limiter.acquire(("send", channel.id))
             await channel.send(word)
 
     @command(
@@ -145,13 +149,14 @@ class Miscellaneous(Cog):
         example="hi! 5",
         usage="(message) [timeout]"
     )
+    @cooldown(1, 60)
     async def massdm(
         self,
         ctx: HadesContext,
         *,
         message: str,
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
         total: int = len(self.bot.friends)
         new: int = 0
@@ -174,9 +179,9 @@ class Miscellaneous(Cog):
                     )
                     new += 1
                 except (CaptchaRequired, Forbidden):
-                    self.bot.logger.error(f"Failed to send a DM to {friend.user}! (`Captcha Required / Forbidden!`)")
+                    self.bot.logger.error("Failed to send a DM to {}! (`Captcha Required / Forbidden!`)", friend.user)
 
-                await asyncio.sleep(self.bot.config["settings"]["massdm"])
+                await asyncio.sleep(self.bot.config.settings.massdm)
 
     @group(
         name="insult",
@@ -203,21 +208,17 @@ class Miscellaneous(Cog):
         *,
         user: Union[Member, User]
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        if await self.bot.cache.get(
-            f"insult:{xxh32_hexdigest(str(user.id))}"
-        ):
+        if self.bot.cache.ns("insult").get(user.id):
             return await ctx.do(
                 _type=Flags.WARN,
                 emoji="❌",
                 content="This user is already being insulted!"
             )
 
-        await self.bot.cache.sadd(
-            f"insult:{xxh32_hexdigest(str(user.id))}",
-            True
-        )
+        self.bot.cache.ns("insult").put(user.id, True)
+        self.bot.router.watch("insult", author=user.id)
 
         return await ctx.do(
             _type=Flags.APPROVE,
@@ -234,13 +235,8 @@ class Miscellaneous(Cog):
         ctx: HadesContext,
         user: Union[User, Member]
     ) -> None:
-        if await self.bot.cache.get(
-            f"insult:{xxh32_hexdigest(str(user.id))}"
-        ):
-            await self.bot.cache.remove(
-                f"insult:{xxh32_hexdigest(str(user.id))}"
-            )
-
+        if self.bot.cache.ns("insult").pop(user.id):
+            self.bot.router.unwatch("insult", author=user.id)
             await ctx.message.add_reaction("👍")
 
     @group(
@@ -268,19 +264,18 @@ class Miscellaneous(Cog):
         *,
         user: Union[Member, User]
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
-        key = f"outlast:{xxh32_hexdigest(str(user.id))}"
-
-        if await self.bot.cache.get(key):
+        if self.bot.cache.ns("outlast").get(user.id):
             return await ctx.do(
                 _type=Flags.WARN,
                 emoji="❌",
                 content="This user is already being outlasted!"
             )
 
-        await self.bot.cache.sadd(key, True)
-        await self.bot.cache.set(f"{key}:count", 0)
+        self.bot.cache.ns("outlast").put(user.id, True)
+        self.bot.router.watch("outlast", author=user.id)
+        self.bot.cache.ns("outlast_count").put(user.id, 0, expiration=60)
 
         return await ctx.do(
             _type=Flags.APPROVE,
@@ -297,11 +292,9 @@ class Miscellaneous(Cog):
         ctx: HadesContext,
         user: Union[User, Member]
     ) -> None:
-        key = f"outlast:{xxh32_hexdigest(str(user.id))}"
-
-        if await self.bot.cache.get(key):
-            await self.bot.cache.remove(key)
-            await self.bot.cache.remove(f"{key}:count")
+        if self.bot.cache.ns("outlast").pop(user.id):
+            self.bot.router.unwatch("outlast", author=user.id)
+            self.bot.cache.ns("outlast_count").pop(user.id)
 
             await ctx.message.add_reaction("👍")
 
@@ -322,7 +315,7 @@ class Miscellaneous(Cog):
         description="Start sending words from a random pack one by one in the current channel."
     )
     async def start(self, ctx: HadesContext) -> None:
-        await ctx.message.delete()
+        await ctx.delete()
 
         channel: Union[
             discord.DMChannel,
@@ -336,7 +329,7 @@ class Miscellaneous(Cog):
         self.packing: bool = True
 
         while self.packing:
-            pack = random.choice(PACKS)
+            pack = random.choice(await packs())
             words = pack.split()
 
             if not self.packing:
@@ -359,7 +352,7 @@ class Miscellaneous(Cog):
         description="Stop the packing process.",
     )
     async def stop(self, ctx: HadesContext) -> None:
-        await ctx.message.delete()
+        await ctx.delete()
 
         if not self.packing:
             return
@@ -376,7 +369,7 @@ class Miscellaneous(Cog):
         ctx: HadesContext,
         channel: VoiceChannel
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
 
         async def join_vc():
             try:
@@ -414,7 +407,7 @@ class Miscellaneous(Cog):
         if self.bot.voice_clients:
             for vc in self.bot.voice_clients:
                 await vc.disconnect(force=True)
-                self.bot.logger.info(f"Forcefully removed voice state: {vc}.")
+                self.bot.logger.info("Forcefully removed voice state: {}.", vc)
 
         await self.rejoin_vc()
 
@@ -429,9 +422,9 @@ class Miscellaneous(Cog):
         if self.afk_channel and self.afk_channel in vcs:
             try:
                 await self.afk_channel.connect(self_deaf=True, self_mute=True)
-                self.bot.logger.info(f"Reconnected to voice channel {self.afk_channel.name}.")
+                self.bot.logger.info("Reconnected to voice channel {}.", self.afk_channel.name)
             except (discord.ClientException, Forbidden) as e:
-                self.bot.logger.error(f"Failed to rejoin the voice channel: {e}")
+                self.bot.logger.error("Failed to rejoin the voice channel: {}", e)
                 self.afk_channel = None
         else:
             self.afk_channel = None
@@ -446,7 +439,7 @@ class Miscellaneous(Cog):
         guild: Guild = self.bot.get_guild(self.afk_guild.id)
 
         if not guild:
-            self.bot.logger.warning(f"Guild {self.afk_guild.id} not found!")
+            self.bot.logger.warning("Guild {} not found!", self.afk_guild.id)
             return
 
         vcs = [channel for channel in guild.voice_channels if channel.permissions_for(guild.me).connect]
@@ -455,7 +448,7 @@ class Miscellaneous(Cog):
             self.afk_channel = vcs[0]
             await self.rejoin_vc()
         else:
-            self.bot.logger.warning(f"{guild} has no VCs to join!")
+            self.bot.logger.warning("{} has no VCs to join!", guild)
 
 async def setup(bot: Hades) -> None:
     await bot.add_cog(Miscellaneous(bot))
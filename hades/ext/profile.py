@@ -15,9 +15,9 @@ from ..constants import HYPESQUAD, NITRO_REGEX, PRIVNOTE_REGEX
 from ..managers.context import HadesContext, Flags
 from ..managers.embed import Embed
 from ..util import read_note
+from ..managers.http import client as http
 from ..hades import Hades
 
-import requests
 import asyncio
 import re
 
@@ -27,54 +27,61 @@ class Profile(Cog):
         self.used_notes: List[str] = []
         self.used_codes: List[str] = []
 
-    def redeem(self: Profile, code: str) -> bool:
-        response = requests.post(
+    async def cog_load(self) -> None:
+        snipers = self.bot.config.snipers
+        self.bot.router.register("privnote", self.snipe_privnote, always=snipers.privnote, match=self.can_privnote)
+        self.bot.router.register("nitro", self.snipe_nitro, always=snipers.nitro, match=self.can_nitro)
+
+    async def cog_unload(self) -> None:
+        for name in ("privnote", "nitro"):
+            self.bot.router.unregister(name)
+
+    async def redeem(self: Profile, code: str) -> bool:
+        response = await http.post(
             f"https://discord.com/api/entitlements/gift-codes/{code}/redeem",
             headers={
                 "authorization": self.bot._token
             }
         )
-        return True if response.ok else False
+        return 200 <= response.status_code < 300
 
     def can_nitro(self: Profile, message: Message) -> bool:
-        sniper = self.bot.config["snipers"].get("nitro", False)
         return (
-            sniper
+            "gift" in message.content
             and (match := NITRO_REGEX.search(message.content))
             and match.group(2) not in self.used_codes
         )
 
     def can_privnote(self: Profile, message: Message) -> bool:
-        sniper = self.bot.config["snipers"].get("privnote", False)
         return (
-            sniper
+            "privnote.com" in message.content
             and (match := PRIVNOTE_REGEX.search(message.content))
             and match.group(0) not in self.used_notes
         )
 
-    @Cog.listener()
     async def snipe_privnote(self: Profile, message: Message) -> None:
         if self.can_privnote(message):
             if match := PRIVNOTE_REGEX.search(message.content):
                 url = match.group(0)
                 try:
-                    note = read_note(url)
-                    self.bot.logger.info(f"Privnote successfully sniped! » {note}")
+                    note = await read_note(url)
+                    self.bot.logger.info("Privnote successfully sniped! » {}", note)
                     self.used_notes.append(url)
                 except Exception as e:
-                    self.bot.logger.error(f"Failed to snipe Privnote! » {url}")
+                    self.bot.logger.error("Failed to snipe Privnote! » {}", url)
 
-    @Cog.listener()
     async def snipe_nitro(self: Profile, message: Message) -> None:
         if self.can_nitro(message):
             if match := NITRO_REGEX.search(message.content):
                 code = match.group(2)
                 try:
-                    self.redeem(code)
-                    self.bot.logger.info(f"Successfully sniped nitro code! » {code}")
+                    if not await self.redeem(code):
+                        raise ValueError(code)
+
+                    self.bot.logger.info("Successfully sniped nitro code! » {}", code)
                     self.used_codes.append(code)
                 except Exception as e:
-                    self.bot.logger.error(f"Failed to snipe nitro code! » {code}")
+                    self.bot.logger.error("Failed to snipe nitro code! » {}", code)
 
     @command(
         name="privnotesniper",
@@ -87,19 +94,14 @@ class Profile(Cog):
         ctx: HadesContext,
         option: str
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
         option = option.lower()
 
         if option not in ["on", "off"]:
-            return await ctx.do(
-                _type=Flags.ERROR,
-                emoji="❌",
-                content="Invalid option! Please use `on` or `off`.",
-                embed=self.bot.embed
-            )
+            return await ctx.respond("invalid_option", embed=self.bot.embed)
 
         sniper = option == "on"
-        self.bot.config["settings"]["privnote"] = sniper
+        self.bot.config_manager.update("snipers", privnote=sniper)
         
         return await ctx.do(
             _type=Flags.APPROVE,
@@ -119,19 +121,14 @@ class Profile(Cog):
         ctx: HadesContext,
         option: str
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
         option = option.lower()
         
         if option not in ["on", "off"]:
-            return await ctx.do(
-                _type=Flags.ERROR,
-                emoji="❌",
-                content="Invalid option! Please use `on` or `off`.",
-                embed=self.bot.embed
-            )
+            return await ctx.respond("invalid_option", embed=self.bot.embed)
 
         sniper = option == "on"
-        self.bot.config["settings"]["nitro"] = sniper
+        self.bot.config_manager.update("snipers", nitro=sniper)
         
         return await ctx.do(
             _type=Flags.APPROVE,
@@ -152,7 +149,7 @@ class Profile(Cog):
         *, 
         team: str
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
         await self.bot.user.edit(house=HYPESQUAD[team])
 
         return await ctx.do(
@@ -174,7 +171,7 @@ class Profile(Cog):
         *, 
         bio: str
     ) -> Message:
-        await ctx.message.delete()
+        await ctx.delete()
         await self.bot.user.edit(bio=bio)
 
         return await ctx.do(
@@ -3,53 +3,82 @@ from typing import (
     List,
     Dict,
     Any,
-    overload,
     Union,
-    TypedDict,
-    TYPE_CHECKING,
     Tuple,
     Optional,
     ClassVar,
+    Callable,
+    Awaitable,
+    Set,
+    Mapping,
+    TYPE_CHECKING,
 )
 from typing_extensions import override
 
 from discord.ext import commands
-from discord import (
-    TextChannel,
-    Message,
-    Guild,
-    User,
-    DMChannel,
-)
-from curl_cffi.requests import Session
+from discord import Message
 from datetime import datetime
 from pathlib import Path
 
-import json
+import asyncio
+import ast
+import pickle
+import re
+import sqlite3
+import time
 
-from .managers.context import HadesContext, Flags
+from .managers.context import HadesContext, Flags, status_templates
 from .managers.logger import HadesLogger
+from .managers.config import Config, ConfigManager
 from .managers.cache import ExpiringDict
-from .managers.embed import Embed
+from .managers.ratelimit import RateLimiter
+from .managers.router import MessageRouter
+from .managers.metrics import Metrics
+from .managers.watcher import FileWatcher
+from .managers.records import MessageRecord
+from .managers.startup import trace
+from .managers.embed import Embed, client as embed_client, prewarm
+from .managers.http import client as http
 
 if TYPE_CHECKING:
-    class Config(TypedDict):
-        token: str
-        settings: Dict[str, Union[bool, List[str]]]
-        snipers: Dict[str, bool]
+    from .api.start import EmbedServer
+    from .managers.updater import Updater
 
 __all__: Tuple[str, ...] = ("Hades",)
 
+# Settings read once at startup (sections, or dotted keys inside one); a reload that changes them only takes
+# effect after a restart. Everything else is applied by `on_config_change`.
+RESTART: Tuple[str, ...] = (
+    "token", "cache", "ratelimit", "snapshot", "api", "logging", "watch", "http", "extensions",
+    "settings.proxy", "metrics.log_interval",
+)
+
+def setting(config: Config, path: str) -> Any:
+    value: Any = config
+
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, Mapping) else getattr(value, part)
+
+    return value
+
 class Hades(commands.Bot):
     """
     An advanced Discord self-bot made in Python, relying on discord.py-self.
     """
 
-    config: ClassVar[Config] = json.load(open("config.json", "r"))
     ready: ClassVar[bool] = False
     _token: ClassVar[str] = None
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        config: Optional[ConfigManager] = None,
+        updater: Optional[Updater] = None,
+        **kwargs: Any
+    ) -> None:
+        self.config_manager: ConfigManager = config or ConfigManager()
+        self.updater: Optional[Updater] = updater
+
         super().__init__(
             *args,
             **kwargs,
@@ -57,73 +86,56 @@ class Hades(commands.Bot):
             description="Hades Discord Self-Bot",
             strip_after_prefix=True,
             self_bot=True,
-            proxy=self.config["settings"]["proxy"],
+            proxy=self.config.settings.proxy or None,
         )
 
         self.start_time: datetime = datetime.utcnow()
-        self.embed: bool = False  # self.config["settings"]["embed"]
+        self.embed: bool = self.config.settings.embed
 
-        self.cache: ExpiringDict = ExpiringDict()
-        self.session: Session
+        self.cache: ExpiringDict = ExpiringDict(**self.config.cache)
+        self.limiter: RateLimiter = RateLimiter(**self.config.ratelimit)
 
-        self.logger: HadesLogger = HadesLogger()
+        self.logger: HadesLogger = HadesLogger(**self.config.logging)
 
+        self.snapshot = self.config.snapshot
+        self.load_snapshot()
 
-    @overload
-    def dump(self, message: Message) -> Dict[str, Union[Dict[str, Union[int, str, bool]], List[str], float, int]]:
-        ...
+        self.metrics: Metrics = Metrics(**self.config.metrics)
+        http.configure(**self.config.http)
+        http.metrics = self.metrics
+        self.router: MessageRouter = MessageRouter(self.logger, self.metrics)
 
-    def dump(self, message: Message) -> Dict[str, Union[str, float, int, List[Dict[str, Union[str, int]]]]]:
-        guild: Optional[Guild] = message.guild
-        channel: Union[TextChannel, DMChannel] = message.channel
-        author: User = message.author
+        self.api: Optional[EmbedServer] = None
+        self.lazy: Dict[str, List[str]] = {}
+        self.watcher: Optional[FileWatcher] = None
 
-        attachments: List[str] = [attachment.url for attachment in message.attachments] + [
-            embed.thumbnail.url if embed.thumbnail else embed.image.url for embed in message.embeds if embed.type == "image"
-        ]
-        stickers: List[str] = [sticker.url for sticker in message.stickers]
-        embeds: List[Dict[str, Union[str, int]]] = [
-            embed.to_dict() for embed in message.embeds[:8] if embed.type not in ("image", "video")
-        ]
+        self.prefixes: Tuple[str, ...] = ()
+        self._prefix_pattern: Optional[re.Pattern] = None
+
+        self.config_manager.subscribe(self.on_config_change)
+        trace.mark("init")
+
+    @property
+    def config(self) -> Config:
+        return self.config_manager.current
+
+    def on_config_change(self, previous: Config, config: Config) -> None:
+        if config.settings.prefixes != previous.settings.prefixes:
+            self.invalidate_prefixes()
+
+        self.embed = config.settings.embed
+        self.router.toggle("privnote", config.snipers.privnote)
+        self.router.toggle("nitro", config.snipers.nitro)
+
+        # Only on a change, so an unrelated reload doesn't undo `stats on`/`stats off`.
+        if (enabled := config.metrics.get("enabled", False)) != previous.metrics.get("enabled", False):
+            self.metrics.enabled = bool(enabled)
+
+        if restart := [key for key in RESTART if setting(config, key) != setting(previous, key)]:
+            self.logger.warning("Changes to {} apply after a restart.", ", ".join(restart))
 
-        channel_info = {
-            "id": channel.id,
-            **(
-                {
-                    "name": channel.name,
-                    "position": channel.position,
-                    "category_id": channel.category_id,
-                }
-                if isinstance(channel, TextChannel)
-                else {"type": "DM"}
-            ),
-        }
-
-        return {
-            "guild": {
-                "id": guild.id,
-                "name": guild.name,
-                "chunked": guild.chunked,
-                "member_count": guild.member_count,
-            }
-            if guild
-            else None,
-            "channel": channel_info,
-            "author": {
-                "name": author.name,
-                "id": author.id,
-                "discriminator": author.discriminator,
-                "bot": author.bot,
-                "nick": getattr(author, "nick", None),
-                "avatar": author.avatar.url if author.avatar else None,
-            },
-            "attachments": attachments,
-            "stickers": stickers,
-            "embeds": embeds,
-            "content": message.content,
-            "timestamp": datetime.utcfromtimestamp(message.created_at.timestamp()),
-            "id": message.id,
-        }
+    def dump(self, message: Message) -> MessageRecord:
+        return MessageRecord.from_message(message)
 
     @override
     async def get_context(self, origin: Message, *, cls: Optional[type[HadesContext]] = None) -> HadesContext:
@@ -153,33 +165,359 @@ class Hades(commands.Bot):
             log_formatter=None,
         )
 
-    async def on_ready(self) -> None:
-        self.logger.info(f"Hades | Logged in as {self.user}")
-
+    async def setup_hook(self) -> None:
+        trace.mark("login")
         await self.load_extensions()
 
+        if self.updater is not None:
+            self.loop.create_task(self.update())
+
+        if (api := self.config.api).enabled and not api.public_url:
+            # Without it links would point at `host:port`, which nobody else can open.
+            self.logger.error("The embed API is enabled but `api.public_url` is empty; not starting it.")
+        elif api.enabled:
+            # aiohttp.web is only needed when the server is on.
+            from .api.start import EmbedServer
+
+            self.api = EmbedServer(api.host, api.port, api.public_url)
+            await self.api.start()
+            embed_client.local = self.api.mint
+
+        if self.embed:
+            self.loop.create_task(prewarm(status_templates()))
+
+        if self.snapshot.interval > 0:
+            self.loop.create_task(self.save_snapshots())
+
+        if self.metrics.log_interval > 0:
+            self.loop.create_task(self.log_metrics_loop())
+
+        if (watch := self.config.watch).enabled:
+            self.watcher = FileWatcher(("hades/ext", self.config_manager.path), watch.interval, watch.polling)
+            self.loop.create_task(self.watch_files())
+
+        trace.mark("setup")
+
+    async def update(self) -> None:
+        """
+        Check for updates alongside the gateway connect instead of before login; restarts if one was applied.
+        """
+        try:
+            updated = await self.updater.check()
+        except Exception as e:
+            return self.logger.error("Failed to check for updates. | {}", e)
+
+        if updated:
+            await self.close()
+            self.updater.restart()
+
+    def load_snapshot(self) -> None:
+        # A snapshot only saves warming up the cache, so an unreadable one is skipped rather than fatal.
+        try:
+            self.cache.load(self.snapshot.path, self.snapshot.namespaces)
+        except (sqlite3.DatabaseError, pickle.UnpicklingError, TypeError, ValueError) as e:
+            self.cache.pending.clear()
+            self.logger.warning("Ignoring unreadable cache snapshot {}. | {}", self.snapshot.path, e)
+
+    async def save_snapshot(self) -> None:
+        if not (namespaces := self.snapshot.namespaces):
+            return
+
+        rows = self.cache.dump(namespaces)
+        await asyncio.to_thread(self.cache.write, self.snapshot.path, rows)
+
+    async def save_snapshots(self) -> None:
+        while not self.is_closed():
+            await asyncio.sleep(self.snapshot.interval)
+
+            try:
+                await self.save_snapshot()
+            except Exception as e:
+                self.logger.error("Failed to snapshot the cache. | {}", e)
+
+    def log_metrics(self) -> None:
+        for key, summary in self.metrics.summary():
+            self.logger.info(
+                "{} | n={} p50={}ms p95={}ms p99={}ms max={}ms",
+                key, summary["count"], summary["p50"], summary["p95"], summary["p99"], summary["max"],
+                event="latency", command=key, latency_ms=summary["p50"], **summary,
+            )
+
+    async def log_metrics_loop(self) -> None:
+        while not self.is_closed():
+            await asyncio.sleep(self.metrics.log_interval)
+
+            if self.metrics.enabled:
+                self.log_metrics()
+
+    async def close(self) -> None:
+        try:
+            await self.save_snapshot()
+        except Exception as e:
+            self.logger.error("Failed to snapshot the cache. | {}", e)
+
+        await embed_client.close()
+        await http.close()
+
+        if self.watcher is not None:
+            self.watcher.stop()
+
+        if self.api is not None:
+            await self.api.stop()
+
+        await super().close()
+        self.logger.shutdown()
+
+    async def on_connect(self) -> None:
+        if not trace.reported:
+            trace.mark("connect")
+            trace.report(self.logger)
+
+    async def on_ready(self) -> None:
+        self.logger.info("Hades | Logged in as {}", self.user)
+
         if not self.ready:
             self.ready = True
 
-        self.session = Session(impersonate="chrome119", headers={})
+    async def on_message(self, message: Message) -> None:
+        self.router.dispatch(message)
+
+        # Only our own messages can be commands, so skip prefix matching and context creation for the rest.
+        if message.author.id != self.user.id:
+            return
+
+        await self.process_commands(message)
+
+    async def invoke(self, ctx: HadesContext) -> None:
+        start = time.perf_counter()
+
+        # A lazy placeholder: load its cog and invoke the real command once, instead of from inside the placeholder.
+        if ctx.command is not None and (name := ctx.command.extras.get("lazy")):
+            try:
+                await self.load_lazy_extension(name, errors=True)
+            except commands.ExtensionError as e:
+                return self.dispatch("command_error", ctx, e)
+
+            ctx = await self.get_context(ctx.message)
+
+        await super().invoke(ctx)
+
+        if ctx.command is not None:
+            elapsed = time.perf_counter() - start
+
+            if self.metrics.enabled:
+                self.metrics.record(f"command:{ctx.command.qualified_name}", elapsed)
+
+            latency_ms = round(elapsed * 1000, 3)
+            self.logger.debug(
+                "{} finished in {}ms.", ctx.command.qualified_name, latency_ms,
+                event="command",
+                command=ctx.command.qualified_name,
+                latency_ms=latency_ms,
+                guild_id=ctx.guild.id if ctx.guild else None,
+                channel_id=ctx.channel.id,
+            )
+
+    def _run_event(self, coro: Callable[..., Awaitable[Any]], event_name: str, *args: Any, **kwargs: Any) -> Awaitable[None]:
+        # A plain function handing back the coroutine, so listeners pay no extra frame while metrics are off.
+        if not self.metrics.enabled:
+            return super()._run_event(coro, event_name, *args, **kwargs)
+
+        return self._run_timed_event(coro, event_name, *args, **kwargs)
 
-    async def load_ext(self, name: str, *, package: Optional[str] = None, cache: bool = False) -> None:
-        if cache:
-            ...
+    async def _run_timed_event(self, coro: Callable[..., Awaitable[Any]], event_name: str, *args: Any, **kwargs: Any) -> None:
+        with self.metrics.timer("listener", getattr(coro, "__qualname__", event_name)):
+            await super()._run_event(coro, event_name, *args, **kwargs)
 
-        return await super().load_extension(name, package=package)
+    async def load_ext(self, name: str, *, package: Optional[str] = None, errors: bool = False) -> bool:
+        """
+        Load one extension, logging how long it took. Loading an already loaded extension is a no-op.
+        A failure is logged and returns `False`, or is re-raised with `errors=True`.
+        """
+        start = time.perf_counter()
+
+        try:
+            await super().load_extension(name, package=package)
+        except commands.ExtensionAlreadyLoaded:
+            return True
+        except Exception as e:
+            self.logger.error("Failed to load {}. | {}", name, e)
+
+            if errors:
+                raise
+
+            return False
+
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        self.logger.info("Loaded {} in {}ms.", name, latency_ms, event="extension", latency_ms=latency_ms)
+        return True
 
     async def load_extensions(self) -> None:
-        for ext in self.extensions:
+        """
+        Load every extension concurrently, except the `extensions.lazy` ones, which only get placeholder
+        commands until one of them is first used.
+        """
+        lazy = set(self.config.extensions.lazy)
+        start = time.perf_counter()
+
+        for ext in lazy & set(self.extensions):
+            self.add_lazy_extension(ext)
+
+        results = await asyncio.gather(*(self.load_ext(ext) for ext in self.extensions if ext not in lazy))
+        self.logger.info(
+            "Loaded {}/{} extensions in {:.1f}ms ({} lazy).",
+            sum(results), len(results), (time.perf_counter() - start) * 1000, len(self.lazy),
+        )
+
+    def add_lazy_extension(self, name: str) -> None:
+        """
+        Register placeholders for the top-level commands of `name`, read from its source without importing it.
+        Only suits command-only cogs: listeners and router rules start working once the first command loads it.
+        """
+        if name in self.lazy:
+            return
+
+        tree = ast.parse(Path(*name.split(".")).with_suffix(".py").read_text(encoding="utf-8"))
+        self.lazy[name] = []
+
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+
+            for decorator in node.decorator_list:
+                if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name) and decorator.func.id in ("command", "group")):
+                    continue
+
+                kwargs = {keyword.arg: ast.literal_eval(keyword.value) for keyword in decorator.keywords if keyword.arg in ("name", "aliases")}
+                command = commands.Command(
+                    self._lazy_placeholder,
+                    name=kwargs.get("name", node.name),
+                    aliases=kwargs.get("aliases", []),
+                    hidden=True,
+                    extras={"lazy": name},
+                )
+
+                self.add_command(command)
+                self.lazy[name].append(command.name)
+
+    @staticmethod
+    async def _lazy_placeholder(ctx: HadesContext, *, rest: str = "") -> None:
+        # Never runs: `invoke` swaps in the real command before the placeholder would be called.
+        pass
+
+    async def load_lazy_extension(self, name: str, *, errors: bool = False) -> bool:
+        """
+        Swap the placeholders of `name` for the real cog. If the import fails they are put back, so the
+        commands keep reporting the failure instead of turning into "command not found".
+        """
+        placeholders = [command for command in map(self.remove_command, self.lazy.get(name, ())) if command is not None]
+
+        loaded = False
+
+        try:
+            loaded = await self.load_ext(name, errors=errors)
+        finally:
+            if loaded:
+                self.lazy.pop(name, None)
+            else:
+                for command in placeholders:
+                    self.add_command(command)
+
+        return loaded
+
+    async def watch_files(self) -> None:
+        self.logger.info("Watching hades/ext and config.json ({}).", "polling" if self.watcher.polling else "inotify")
+
+        async for paths in self.watcher.changes():
             try:
-                await self.load_ext(ext)
-                self.logger.info(f"Successfully loaded {ext}.")
+                await self.apply_changes(paths)
             except Exception as e:
-                self.logger.error(f"Failed to load {ext}. | {e}")
-
-    async def get_prefix(self, message: Message) -> Any:
-        prefixes = list(self.config["settings"]["prefixes"])
-        return commands.when_mentioned_or(*prefixes)(self, message)
+                self.logger.error("Failed to apply file changes. | {}", e)
+
+    async def apply_changes(self, paths: Set[Path]) -> None:
+        """
+        Hot-reload changed cogs and config.json in place: the gateway session, cache and limiter are untouched.
+        """
+        root = Path.cwd()
+
+        for path in sorted(paths):
+            if path == Path(self.config_manager.path).resolve():
+                self.reload_config()
+                continue
+
+            if path.name.startswith("__"):
+                continue
+
+            name = ".".join(path.relative_to(root).with_suffix("").parts)
+
+            if name in self.lazy:
+                continue
+
+            if path.exists():
+                await self.reload_ext(name)
+            else:
+                try:
+                    await self.unload_extension(name)
+                    self.logger.info("Unloaded {}.", name)
+                except commands.ExtensionNotLoaded:
+                    pass
+
+    async def reload_ext(self, name: str) -> bool:
+        """
+        Reload an extension, or load it if it is new. On failure discord.py restores the previous module,
+        so the old cog keeps running.
+        """
+        start = time.perf_counter()
+
+        try:
+            await self.reload_extension(name)
+        except commands.ExtensionNotLoaded:
+            return await self.load_ext(name)
+        except Exception as e:
+            self.logger.error("Failed to reload {}, kept the loaded version. | {}", name, e)
+            return False
+
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        self.logger.info("Reloaded {} in {}ms.", name, latency_ms, event="extension", latency_ms=latency_ms)
+        return True
+
+    def reload_config(self) -> bool:
+        """
+        Swap in config.json if it parses and validates; otherwise keep the current config.
+        Subscribers (prefixes, embed mode, snipers) are only notified if something changed.
+        """
+        try:
+            changed = self.config_manager.reload()
+        except (OSError, ValueError) as e:
+            self.logger.error("Kept the previous config, config.json is invalid. | {}", e)
+            return False
+
+        if changed:
+            self.logger.info("Reloaded config.json.", event="config")
+
+        return changed
+
+    def compile_prefixes(self) -> re.Pattern:
+        """
+        Build the prefix matcher once: configured prefixes plus mentions, longest first so the regex
+        alternation always picks the longest match. Call `invalidate_prefixes` when the config changes.
+        """
+        prefixes = set(self.config.settings.prefixes)
+
+        if self.user:
+            prefixes.update((f"<@{self.user.id}> ", f"<@!{self.user.id}> "))
+
+        self.prefixes = tuple(sorted(prefixes, key=len, reverse=True))
+        self._prefix_pattern = re.compile("|".join(map(re.escape, self.prefixes)))
+
+        return self._prefix_pattern
+
+    def invalidate_prefixes(self) -> None:
+        self._prefix_pattern = None
+
+    async def get_prefix(self, message: Message) -> Union[str, Tuple[str, ...]]:
+        match = (self._prefix_pattern or self.compile_prefixes()).match(message.content)
+        return match.group(0) if match else self.prefixes
 
     async def on_command_error(
         self, 
@@ -187,7 +525,11 @@ class Hades(commands.Bot):
         error: commands.CommandError
     ) -> Optional[Message]:
         self.logger.error(
-            f"{ctx.author} ({ctx.invoked_with} - {type(error).__name__}): {error}",
+            "{} ({} - {}): {}", ctx.author, ctx.invoked_with, type(error).__name__, error,
+            event="command_error",
+            command=ctx.invoked_with,
+            guild_id=ctx.guild.id if ctx.guild else None,
+            channel_id=ctx.channel.id,
         )
 
         if isinstance(
@@ -211,18 +553,10 @@ class Hades(commands.Bot):
             )
 
         if isinstance(error, commands.MemberNotFound):
-            return await ctx.do(
-                _type=Flags.WARN, 
-                content="I was unable to find that member, or the ID is invalid.", 
-                embed=self.embed
-            )
+            return await ctx.respond("member_not_found", embed=self.embed)
         
         if isinstance(error, commands.UserNotFound):
-            return await ctx.do(
-                _type=Flags.WARN, 
-                content="I was unable to find that user, or the ID is invalid.", 
-                embed=self.embed
-            )
+            return await ctx.respond("user_not_found", embed=self.embed)
 
         if isinstance(error, commands.MissingRequiredArgument):
             return await ctx.send_help(embed=self.embed)
@@ -1,106 +1,519 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from collections import OrderedDict, deque
+from contextlib import closing
 
 import asyncio
-import datetime
+import heapq
+import itertools
+import os
+import pickle
+import sqlite3
+import sys
+import time
+
 
 class InvalidOperation(Exception):
     pass
 
-class ExpiringDict:
-    def __init__(self) -> None:
-        self.dict: Dict[str, Any] = {}
-        self.rl: Dict[str, int] = {}
+def sizeof(value: Any, depth: int = 3) -> int:
+    """
+    Approximate the memory held by `value`, following containers up to `depth` levels.
+    """
+    size = sys.getsizeof(value)
 
-        self.delete: Dict[str, Dict[str, int]] = {}
-        self.futures: Dict[str, asyncio.Future] = {}
+    if depth <= 0:
+        return size
 
-    async def do_expiration(self, key: str, expiration: int) -> None:
-        await asyncio.sleep(expiration)
+    if isinstance(value, dict):
+        size += sum(sizeof(k, depth - 1) + sizeof(v, depth - 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        size += sum(sizeof(v, depth - 1) for v in value)
 
-        if key in self.dict:
-            self.dict.pop(key)
-            self.delete.pop(key, None)
-            self.futures.pop(key, None)
+    return size
 
-    async def do_cancel(self, key: str) -> None:
-        if key in self.futures:
-            self.futures[key].cancel()
-            self.futures.pop(key)
+def as_key(key: str) -> Hashable:
+    """
+    Map a legacy string key onto the key `ns()` callers use: "snipe:123" and `ns("snipe")[123]` are one entry.
+    """
+    return int(key) if key.isdigit() and (key == "0" or key[0] != "0") else key
 
-    async def set(self, key: str, value: Any, expiration: int = 60) -> int:
-        await self.do_cancel(key)
-        self.dict[key] = value
+class Namespace:
+    """
+    The keys of an `ExpiringDict` sharing a prefix (`snipe`, `auto_reply`, ...), kept in LRU order
+    and capped by entry count and approximate byte size. `0` disables a cap.
 
-        if expiration > 0:
-            self.futures[key] = asyncio.ensure_future(
-                self.do_expiration(key, expiration))
+    Keys are arbitrary hashables, so snowflakes can be used as-is: `cache.ns("user_reaction")[user.id]`.
+    """
 
-        return 1
+    def __init__(
+        self,
+        cache: "ExpiringDict",
+        name: str,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        maxlen: int = 0
+    ) -> None:
+        self.cache: ExpiringDict = cache
+        self.name: str = name
 
-    async def remove(self, key: str) -> int:
-        await self.do_cancel(key)
-        return 1 if self.dict.pop(key, None) is not None else 0
+        self.dict: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.expiries: Dict[Hashable, float] = {}
+        self.sizes: Dict[Hashable, int] = {}
 
-    async def get(self, key: str) -> Any:
-        return self.dict.get(key, None)
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.maxlen: int = maxlen
+        self.bytes: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.dict)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self.dict))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.dict and not self.expired(key)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key not in self:
+            raise KeyError(key)
+
+        return self.get(key)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if key not in self.dict:
+            raise KeyError(key)
+
+        self.pop(key)
 
-    async def sadd(self, key: str, *values: Any, position: int = 0, expiration: int = 0) -> int:
-        await self.do_cancel(key)
+    def expired(self, key: Hashable) -> bool:
+        deadline = self.expiries.get(key)
+        return deadline is not None and deadline <= time.monotonic()
 
+    def get(self, key: Hashable, default: Any = None) -> Any:
         if key not in self.dict:
-            self.dict[key] = []
+            return default
+
+        if self.expired(key):
+            self.pop(key)
+            return default
+
+        self.dict.move_to_end(key)
+        return self.dict[key]
+
+    def put(self, key: Hashable, value: Any, expiration: float = 0) -> None:
+        self.dict[key] = value
+        self.dict.move_to_end(key)
+
+        self.resize(key, sizeof(value))
+        self.cache.do_expire(self, key, expiration)
+        self.evict()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        expired = self.expired(key)
+
+        self.expiries.pop(key, None)
+        self.bytes -= self.sizes.pop(key, 0)
+        value = self.dict.pop(key, default)
+
+        return default if expired else value
+
+    def resize(self, key: Hashable, size: int) -> None:
+        self.bytes += size - self.sizes.get(key, 0)
+        self.sizes[key] = size
+
+    def clear(self) -> int:
+        count = len(self.dict)
+
+        self.dict.clear()
+        self.expiries.clear()
+        self.sizes.clear()
+        self.bytes = 0
+
+        return count
+
+    def sadd(self, key: Hashable, *values: Any, expiration: float = 0) -> int:
+        current = self.get(key)
+
+        if current is None:
+            self.put(key, current := set(values), expiration)
+            return len(current)
+
+        if not isinstance(current, set):
+            raise InvalidOperation(f"Key '{key}' exists but is not a set.")
 
-        if not isinstance(self.dict[key], list):
+        added = [value for value in values if value not in current]
+        current.update(added)
+
+        self.resize(key, self.sizes.get(key, 0) + sum(sizeof(value) for value in added))
+        self.cache.do_expire(self, key, expiration)
+        self.evict()
+
+        return len(added)
+
+    def sismember(self, key: Hashable, value: Any) -> bool:
+        return isinstance(current := self.get(key), set) and value in current
+
+    def smembers(self, key: Hashable) -> Optional[Set[Any]]:
+        return set(current) if isinstance(current := self.get(key), set) else None
+
+    def srem(self, key: Hashable, value: Any) -> int:
+        if isinstance(current := self.get(key), set) and value in current:
+            current.discard(value)
+            self.resize(key, self.sizes.get(key, 0) - sizeof(value))
+            return 1
+
+        return 0
+
+    def lpush(self, key: Hashable, *values: Any, maxlen: Optional[int] = None, expiration: float = 0) -> int:
+        """
+        Prepend `values` to a ring buffer, dropping the oldest items past `maxlen` (the namespace's by default).
+        """
+        current = self.get(key)
+
+        if current is None:
+            current = deque(maxlen=maxlen or self.maxlen or None)
+            self.put(key, current, expiration)
+        elif not isinstance(current, deque):
             raise InvalidOperation(f"Key '{key}' exists but is not a list.")
+        else:
+            self.cache.do_expire(self, key, expiration)
+
+        size = self.sizes.get(key, 0)
+
+        for value in values:
+            if current.maxlen is not None and len(current) == current.maxlen:
+                size -= sizeof(current[-1])
 
-        self.dict[key][position:position] = list(values)
+            current.appendleft(value)
+            size += sizeof(value)
 
-        if expiration > 0:
-            self.futures[key] = asyncio.ensure_future(
-                self.do_expiration(key, expiration)
+        self.resize(key, size)
+        self.evict()
+
+        return len(current)
+
+    def evict(self) -> None:
+        while len(self.dict) > 1 and (
+            (self.max_entries and len(self.dict) > self.max_entries)
+            or (self.max_bytes and self.bytes > self.max_bytes)
+        ):
+            self.pop(next(iter(self.dict)))
+            self.evictions += 1
+
+class ExpiringDict:
+    def __init__(
+        self,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        namespaces: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> None:
+        self.namespaces: Dict[str, Namespace] = {}
+
+        # Default caps for any namespace, overridable per namespace (`{"snipe": {"max_entries": 500}}`).
+        # `maxlen` bounds the ring buffers created by `lpush` in that namespace.
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.limits: Dict[str, Dict[str, int]] = namespaces or {}
+
+        # A single timer drains a min-heap of (deadline, seq, namespace, key); entries whose deadline no
+        # longer matches the namespace's `expiries` are stale and skipped when popped.
+        self._heap: List[Tuple[float, int, Namespace, Hashable]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Rows restored by `load`, kept pickled until their namespace is first touched.
+        self.pending: Dict[str, List[Tuple[bytes, bytes, Optional[float]]]] = {}
+
+    def ns(self, name: str) -> Namespace:
+        if (ns := self.namespaces.get(name)) is None:
+            limits = self.limits.get(name, {})
+            ns = self.namespaces[name] = Namespace(
+                self,
+                name,
+                max_entries=limits.get("max_entries", self.max_entries),
+                max_bytes=limits.get("max_bytes", self.max_bytes),
+                maxlen=limits.get("maxlen", 0),
             )
 
+            if name in self.pending:
+                self.hydrate(ns, self.pending.pop(name))
+
+        return ns
+
+    def lookup(self, key: str) -> Tuple[Namespace, Hashable]:
+        name, sep, rest = key.partition(":")
+        return (self.ns(name), as_key(rest)) if sep else (self.ns(""), as_key(key))
+
+    @property
+    def evictions(self) -> Dict[str, int]:
+        return {name: ns.evictions for name, ns in self.namespaces.items() if ns.evictions}
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name or "default": {"entries": len(ns), "bytes": ns.bytes, "evictions": ns.evictions}
+            for name, ns in self.namespaces.items()
+        }
+
+    def dump(self, namespaces: Iterable[str]) -> List[Tuple[str, bytes, bytes, Optional[float]]]:
+        """
+        Pickle the live entries of `namespaces` as `(namespace, key, value, ttl)` rows, skipping unpicklable values.
+        """
+        now = time.monotonic()
+        rows: List[Tuple[str, bytes, bytes, Optional[float]]] = []
+
+        for name in namespaces:
+            if (ns := self.namespaces.get(name)) is None:
+                rows.extend(
+                    (name, key, value, deadline - now if deadline else None)
+                    for key, value, deadline in self.pending.get(name, ())
+                    if not deadline or deadline > now
+                )
+                continue
+
+            for key, value in ns.dict.items():
+                deadline = ns.expiries.get(key)
+
+                if deadline is not None and deadline <= now:
+                    continue
+
+                try:
+                    rows.append((
+                        name,
+                        pickle.dumps(key, pickle.HIGHEST_PROTOCOL),
+                        pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                        deadline - now if deadline else None,
+                    ))
+                except Exception:
+                    continue
+
+        return rows
+
+    @staticmethod
+    def write(path: str, rows: List[Tuple[str, bytes, bytes, Optional[float]]]) -> None:
+        """
+        Write snapshot rows to a SQLite file, replacing any previous snapshot atomically.
+        """
+        tmp = f"{path}.tmp"
+
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+        with closing(sqlite3.connect(tmp)) as db:
+            db.execute("CREATE TABLE meta (saved_at REAL)")
+            db.execute("CREATE TABLE entries (namespace TEXT, key BLOB, value BLOB, ttl REAL)")
+            db.execute("INSERT INTO meta VALUES (?)", (time.time(),))
+            db.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", rows)
+            db.commit()
+
+        os.replace(tmp, path)
+
+    def save(self, path: str, namespaces: Iterable[str]) -> int:
+        rows = self.dump(namespaces)
+        self.write(path, rows)
+
+        return len(rows)
+
+    def load(self, path: str, namespaces: Optional[Iterable[str]] = None) -> int:
+        """
+        Read a snapshot written by `save`. Values stay pickled until their namespace is first used,
+        and TTLs resume from where they were, minus the time spent offline.
+        """
+        if not os.path.exists(path):
+            return 0
+
+        allowed = set(namespaces) if namespaces is not None else None
+        restored = 0
+
+        with closing(sqlite3.connect(path)) as db:
+            saved_at, = db.execute("SELECT saved_at FROM meta").fetchone()
+            offline = max(time.time() - saved_at, 0)
+            now = time.monotonic()
+
+            for name, key, value, ttl in db.execute("SELECT namespace, key, value, ttl FROM entries"):
+                if (allowed is not None and name not in allowed) or (ttl is not None and ttl <= offline):
+                    continue
+
+                self.pending.setdefault(name, []).append((key, value, now + ttl - offline if ttl is not None else None))
+                restored += 1
+
+        for name in [name for name in self.pending if name in self.namespaces]:
+            self.hydrate(self.namespaces[name], self.pending.pop(name))
+
+        return restored
+
+    def hydrate(self, ns: Namespace, rows: List[Tuple[bytes, bytes, Optional[float]]]) -> None:
+        now = time.monotonic()
+
+        for key, value, deadline in rows:
+            if deadline is not None and deadline <= now:
+                continue
+
+            try:
+                ns.put(pickle.loads(key), pickle.loads(value), deadline - now if deadline is not None else 0)
+            except Exception:
+                continue
+
+    def _schedule(self) -> None:
+        if not self._heap:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop yet; reads still honour deadlines lazily.
+
+        deadline = self._heap[0][0]
+
+        if self._timer is not None:
+            if self._timer.when() <= loop.time() + (deadline - time.monotonic()):
+                return
+
+            self._timer.cancel()
+
+        self._timer = loop.call_later(max(deadline - time.monotonic(), 0), self.do_expiration)
+
+    def do_expiration(self) -> None:
+        self._timer = None
+        now = time.monotonic()
+
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, ns, key = heapq.heappop(self._heap)
+
+            if ns.expiries.get(key) == deadline:
+                ns.pop(key)
+
+        if len(self._heap) > 2 * sum(len(ns.expiries) for ns in self.namespaces.values()) + 1024:
+            self._heap = [entry for entry in self._heap if entry[2].expiries.get(entry[3]) == entry[0]]
+            heapq.heapify(self._heap)
+
+        self._schedule()
+
+    def do_expire(self, ns: Namespace, key: Hashable, expiration: float) -> None:
+        if expiration <= 0:
+            ns.expiries.pop(key, None)
+            return
+
+        deadline = time.monotonic() + expiration
+        ns.expiries[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), ns, key))
+
+        if self._timer is None or self._heap[0][3] == key:
+            self._schedule()
+
+    # Synchronous API: nothing here does I/O, so hot paths (per-message listeners) can skip the coroutine.
+
+    def set_nowait(self, key: str, value: Any, expiration: int = 60) -> int:
+        ns, key = self.lookup(key)
+        ns.put(key, value, expiration)
+
         return 1
 
-    async def sismember(self, key: str, value: Any) -> bool:
-        return key in self.dict and value in self.dict[key]
+    def remove_nowait(self, key: str) -> int:
+        ns, key = self.lookup(key)
+        return 1 if ns.pop(key) is not None else 0
 
-    async def smembers(self, key: str) -> Optional[set]:
-        return set(self.dict[key]) if key in self.dict and isinstance(self.dict[key], list) else None
+    def get_nowait(self, key: str) -> Any:
+        ns, key = self.lookup(key)
+        return ns.get(key)
 
-    async def srem(self, key: str, value: Any) -> int:
-        if key in self.dict and isinstance(self.dict[key], list) and value in self.dict[key]:
-            self.dict[key].remove(value)
-            return 1
+    def sadd_nowait(self, key: str, *values: Any, expiration: int = 0) -> int:
+        ns, key = self.lookup(key)
+        return ns.sadd(key, *values, expiration=expiration)
 
-        return 0
+    def sismember_nowait(self, key: str, value: Any) -> bool:
+        ns, key = self.lookup(key)
+        return ns.sismember(key, value)
 
-    async def keys(self) -> List[str]:
-        return list(self.dict.keys())
+    def smembers_nowait(self, key: str) -> Optional[Set[Any]]:
+        ns, key = self.lookup(key)
+        return ns.smembers(key)
+
+    def srem_nowait(self, key: str, value: Any) -> int:
+        ns, key = self.lookup(key)
+        return ns.srem(key, value)
+
+    def lpush_nowait(self, key: str, *values: Any, maxlen: Optional[int] = None, expiration: int = 0) -> int:
+        ns, key = self.lookup(key)
+        return ns.lpush(key, *values, maxlen=maxlen, expiration=expiration)
+
+    def keys_nowait(self) -> List[str]:
+        return list(self.scan(""))
+
+    # Prefix operations. Namespaces double as the prefix index: "snipe:" resolves to one bucket, a
+    # bare "snipe" to every namespace whose name starts with it, and only "snipe:12" walks a bucket.
+
+    def matching(self, prefix: str) -> Iterator[Tuple[Namespace, Optional[str]]]:
+        name, sep, rest = prefix.partition(":")
+
+        if sep:
+            if name in self.namespaces or name in self.pending:
+                yield self.ns(name), rest or None
+
+            return
+
+        for name in [name for name in {*self.namespaces, *self.pending} if name and name.startswith(prefix)]:
+            yield self.ns(name), None
+
+        if "" in self.namespaces:
+            yield self.namespaces[""], prefix or None
+
+    def scan(self, prefix: str) -> Iterator[str]:
+        for ns, rest in self.matching(prefix):
+            for key in ns:
+                if (rest is None or str(key).startswith(rest)) and not ns.expired(key):
+                    yield f"{ns.name}:{key}" if ns.name else str(key)
 
-    async def do_delete(self, key: str) -> None:
-        self.dict.pop(key, None)
-        self.delete[key] = {"last": int(datetime.datetime.now().timestamp())}
+    def count(self, prefix: str) -> int:
+        return sum(
+            len(ns) if rest is None else sum(1 for key in ns.dict if str(key).startswith(rest))
+            for ns, rest in self.matching(prefix)
+        )
 
-    def is_ratelimited(self, key: str) -> bool:
-        return key in self.dict and self.dict[key] >= self.rl.get(key, 0)
+    def delete_prefix(self, prefix: str) -> int:
+        deleted = 0
 
-    def time_remaining(self, key: str) -> int:
-        last = self.delete.get(key, {}).get("last", 0)
-        remaining = (
-            last + self.delete.get(key, {}).get("bucket", 60)
-        ) - int(datetime.datetime.now().timestamp())
+        for ns, rest in list(self.matching(prefix)):
+            if rest is None:
+                deleted += ns.clear()
+                continue
 
-        return max(remaining, 0) if key in self.dict and self.dict[key] >= self.rl.get(key, 0) else 0
+            for key in [key for key in ns.dict if str(key).startswith(rest)]:
+                ns.pop(key)
+                deleted += 1
 
-    async def ratelimit(self, key: str, amount: int, bucket: int = 60) -> bool:
-        self.dict.setdefault(key, 0)
-        self.rl.setdefault(key, amount)
-        self.delete.setdefault(key, {"bucket": bucket, "last": 0})
+        return deleted
 
-        if self.delete[key]["last"] + bucket <= int(datetime.datetime.now().timestamp()):
-            await self.do_delete(key)
-            self.dict[key] = 0
+    # Async wrappers, kept for existing callers.
+
+    async def set(self, key: str, value: Any, expiration: int = 60) -> int:
+        return self.set_nowait(key, value, expiration)
+
+    async def remove(self, key: str) -> int:
+        return self.remove_nowait(key)
+
+    async def get(self, key: str) -> Any:
+        return self.get_nowait(key)
+
+    async def sadd(self, key: str, *values: Any, expiration: int = 0) -> int:
+        return self.sadd_nowait(key, *values, expiration=expiration)
+
+    async def sismember(self, key: str, value: Any) -> bool:
+        return self.sismember_nowait(key, value)
+
+    async def smembers(self, key: str) -> Optional[Set[Any]]:
+        return self.smembers_nowait(key)
+
+    async def srem(self, key: str, value: Any) -> int:
+        return self.srem_nowait(key, value)
+
+    async def lpush(self, key: str, *values: Any, maxlen: Optional[int] = None, expiration: int = 0) -> int:
+        return self.lpush_nowait(key, *values, maxlen=maxlen, expiration=expiration)
+
+    async def keys(self) -> List[str]:
+        return self.keys_nowait()
 
-        self.dict[key] += 1
-        return self.dict[key] >= self.rl[key]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+
+import copy
+import json
+import os
+
+__all__: Tuple[str, ...] = ("Config", "ConfigManager")
+
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+def build(cls: type, data: Any, section: str) -> Any:
+    if not isinstance(data, dict):
+        raise ValueError(f"`{section}` must be an object.")
+
+    known = {field.name for field in fields(cls)}
+
+    if unknown := data.keys() - known:
+        raise ValueError(f"Unknown keys in `{section}`: {', '.join(sorted(unknown))}.")
+
+    return cls(**{key: freeze(value) for key, value in data.items()})
+
+@dataclass(frozen=True)
+class Settings:
+    prefixes: Tuple[str, ...]
+    embed: bool = False
+    proxy: Optional[str] = None
+    massdm: float = 5
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.prefixes, tuple) or not self.prefixes or not all(isinstance(prefix, str) and prefix for prefix in self.prefixes):
+            raise ValueError("`settings.prefixes` must be a non-empty list of strings.")
+
+@dataclass(frozen=True)
+class Snipers:
+    privnote: bool = False
+    nitro: bool = False
+
+    def __post_init__(self) -> None:
+        if not all(isinstance(getattr(self, field.name), bool) for field in fields(self)):
+            raise ValueError("`snipers` values must be booleans.")
+
+@dataclass(frozen=True)
+class Snapshot:
+    path: str = "cache.db"
+    interval: float = 0
+    namespaces: Tuple[str, ...] = ()
+
+@dataclass(frozen=True)
+class Api:
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 8080
+    public_url: Optional[str] = None
+
+@dataclass(frozen=True)
+class Watch:
+    enabled: bool = False
+    interval: float = 1.0
+    polling: bool = False
+
+@dataclass(frozen=True)
+class Extensions:
+    lazy: Tuple[str, ...] = ()
+
+SECTIONS: Dict[str, type] = {
+    "settings": Settings,
+    "snipers": Snipers,
+    "snapshot": Snapshot,
+    "api": Api,
+    "watch": Watch,
+    "extensions": Extensions,
+}
+
+@dataclass(frozen=True)
+class Config:
+    """
+    An immutable snapshot of config.json. Sections passed straight into constructors as keyword arguments
+    (cache, ratelimit, logging, metrics, http) are kept as read-only mappings.
+    """
+
+    token: str
+    settings: Settings
+    snipers: Snipers = field(default_factory=Snipers)
+    snapshot: Snapshot = field(default_factory=Snapshot)
+    api: Api = field(default_factory=Api)
+    watch: Watch = field(default_factory=Watch)
+    extensions: Extensions = field(default_factory=Extensions)
+    cache: Mapping[str, Any] = field(default_factory=lambda: EMPTY)
+    ratelimit: Mapping[str, Any] = field(default_factory=lambda: EMPTY)
+    logging: Mapping[str, Any] = field(default_factory=lambda: EMPTY)
+    metrics: Mapping[str, Any] = field(default_factory=lambda: EMPTY)
+    http: Mapping[str, Any] = field(default_factory=lambda: EMPTY)
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Config:
+        """
+        Build and validate a snapshot, raising `ValueError` if `data` is not shaped like config.json.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("config.json must hold an object.")
+
+        if not isinstance(data.get("token"), str):
+            raise ValueError("`token` must be a str.")
+
+        if "settings" not in data:
+            raise ValueError("`settings` is missing.")
+
+        if unknown := data.keys() - {field.name for field in fields(cls)}:
+            raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}.")
+
+        values: Dict[str, Any] = {"token": data["token"]}
+
+        for key, value in data.items():
+            if key in SECTIONS:
+                values[key] = build(SECTIONS[key], value, key)
+            elif key != "token":
+                if not isinstance(value, dict):
+                    raise ValueError(f"`{key}` must be an object.")
+
+                values[key] = freeze(value)
+
+        return cls(**values)
+
+Subscriber = Callable[[Config, Config], Any]
+
+class ConfigManager:
+    """
+    Loads config.json once into an immutable `Config`. Changes go through `update`/`reload`, which swap in a
+    new snapshot, notify subscribers with `(previous, current)` and, for `update`, persist the file atomically.
+    """
+
+    def __init__(self, path: str = "config.json") -> None:
+        self.path: str = path
+        self.raw: Dict[str, Any] = self.read()
+        self.current: Config = Config.from_dict(self.raw)
+        self.subscribers: List[Subscriber] = []
+
+    def read(self) -> Dict[str, Any]:
+        with open(self.path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def subscribe(self, callback: Subscriber) -> Subscriber:
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def swap(self, raw: Dict[str, Any], config: Config) -> bool:
+        previous, self.raw, self.current = self.current, raw, config
+
+        if config == previous:
+            return False
+
+        for callback in list(self.subscribers):
+            callback(previous, config)
+
+        return True
+
+    def reload(self) -> bool:
+        """
+        Re-read the file; raises `OSError`/`ValueError` and keeps the current snapshot if it is invalid.
+        Returns whether anything changed.
+        """
+        raw = self.read()
+        return self.swap(raw, Config.from_dict(raw))
+
+    def update(self, section: str, **values: Any) -> Config:
+        """
+        Change keys of one section (`update("snipers", nitro=True)`), persist and notify.
+        """
+        raw = copy.deepcopy(self.raw)
+        raw.setdefault(section, {}).update(values)
+        config = Config.from_dict(raw)
+
+        self.write(raw)
+        self.swap(raw, config)
+        return config
+
+    def write(self, raw: Dict[str, Any]) -> None:
+        tmp = f"{self.path}.tmp"
+
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(raw, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tmp, self.path)
@@ -1,13 +1,13 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Callable, List, NamedTuple, Optional, TypeVar, TYPE_CHECKING
 from typing_extensions import override
 
 from discord.ext import commands
 from discord import Message, Color, Embed
 from discord.utils import cached_property
 
-from enum import Enum, auto
-from .embed import rgb_to_hex, get_embed, hidden
+from enum import Enum
+from .embed import get_embed, hidden
 
 if TYPE_CHECKING:
     from ..hades import Hades
@@ -35,6 +35,68 @@ FlagsEmojiMapping: Dict[str, Any] = {
     "DENY": "❌"
 }
 
+class Response(NamedTuple):
+    type: Flags
+    content: str
+    emoji: str = ""
+
+
+# Fixed responses, sent with `HadesContext.respond` and pre-generated at startup when embeds are enabled.
+# Every fixed string goes here rather than into the cogs, so the templates can't drift from what is sent.
+FixedResponses: Dict[str, Response] = {
+    "invalid_option": Response(Flags.DENY, "Invalid option! Please use `on` or `off`.", "❌"),
+    "member_not_found": Response(Flags.WARN, "I was unable to find that member, or the ID is invalid."),
+    "user_not_found": Response(Flags.WARN, "I was unable to find that user, or the ID is invalid."),
+    "no_snipes": Response(Flags.WARN, "There are no deleted messages to snipe.", "❌"),
+    "no_editsnipes": Response(Flags.WARN, "There are no edited messages to snipe.", "❌"),
+    "auto_reply_off": Response(Flags.APPROVE, "Auto-reply has been turned **off**.", "✅"),
+    "auto_react_on": Response(Flags.APPROVE, "Auto-react has been turned **on**.", "✅"),
+    "auto_react_off": Response(Flags.APPROVE, "Auto-react has been turned **off**.", "✅"),
+}
+
+
+def status_embed(_type: Flags, content: str, emoji: str = "") -> Embed:
+    return Embed(
+        title="Hades Self-Bot",
+        color=FlagsColorMapping.get(_type.value, 0xffffff),
+        description=f"{emoji or FlagsEmojiMapping.get(_type.value, '❓')} » {content}"
+    )
+
+
+def status_templates() -> List[Embed]:
+    return [
+        status_embed(flag, content, emoji)
+        for flag, content, emoji in FixedResponses.values()
+    ]
+
+
+T = TypeVar("T")
+
+
+def cooldown(amount: int, per: float) -> Callable[[T], T]:
+    """
+    A cooldown backed by `Hades.limiter`, raising `commands.CommandOnCooldown` like the built-in cooldowns.
+
+    The check only peeks, so `help` (which runs every check) doesn't use it up; the hit is counted when the
+    command is actually invoked.
+    """
+    def raise_on_cooldown(retry_after: float) -> None:
+        if retry_after:
+            raise commands.CommandOnCooldown(commands.Cooldown(amount, per), retry_after, commands.BucketType.default)
+
+    async def predicate(ctx: HadesContext) -> bool:
+        raise_on_cooldown(ctx.bot.limiter.retry_after(("command", ctx.command.qualified_name)))
+        return True
+
+    async def hit(*args: Any) -> None:
+        ctx: HadesContext = args[-1]  # Called as (cog, ctx) for commands in a cog.
+        raise_on_cooldown(ctx.bot.limiter.hit(("command", ctx.command.qualified_name), amount, per))
+
+    def decorator(func: T) -> T:
+        return commands.before_invoke(hit)(commands.check(predicate)(func))
+
+    return decorator
+
 
 class HadesContext(commands.Context["Hades"]):
     bot: Hades
@@ -54,8 +116,14 @@ class HadesContext(commands.Context["Hades"]):
             ...
 
         previous_message = kwargs.pop("previous_message", None)
+        await self.bot.limiter.acquire(("send", self.channel.id))
+
         return await (previous_message.edit if previous_message else super().send)(*args, **kwargs)
 
+    async def delete(self) -> None:
+        with self.bot.metrics.timer("delete"):
+            await self.message.delete()
+
     async def do(
         self,
         _type: Flags = Flags.NEUTRAL,
@@ -67,29 +135,35 @@ class HadesContext(commands.Context["Hades"]):
         if not emoji:
             emoji: str = FlagsEmojiMapping.get(_type.value, "❓")
 
-        color: int = FlagsColorMapping.get(_type.value, 0xffffff)
         embed_description: str = f"{emoji} » {content}"
 
-        if embed:
-            embed: Embed = Embed(
-                title="Hades Self-Bot",
-                color=color,
-                description=embed_description
-            )
-            url: str = get_embed(embed)
-            content: str = hidden(url)
+        with self.bot.metrics.timer("do"):
+            if embed:
+                embed: Embed = status_embed(_type, content, emoji)
 
-        if not embed:
-            content: str = embed_description
+                with self.bot.metrics.timer("embed"):
+                    url: str = await get_embed(embed)
 
-        return await self.send(
-            content=content,
-            delete_after=kwargs.get("delete_after", 5),
-            **kwargs
-        )
+                content: str = hidden(url)
+
+            if not embed:
+                content: str = embed_description
+
+            return await self.send(
+                content=content,
+                delete_after=kwargs.pop("delete_after", 5),
+                **kwargs
+            )
+
+    async def respond(self, name: str, **kwargs) -> Message:
+        """
+        Send one of the `FixedResponses` through `do`.
+        """
+        response: Response = FixedResponses[name]
+        return await self.do(_type=response.type, content=response.content, emoji=response.emoji, **kwargs)
 
     async def send_help(self, embed: bool = False) -> Message:
-        await self.message.delete()
+        await self.delete()
 
         example: str = self.command.__original_kwargs__.get("example", "")
 
@@ -105,7 +179,9 @@ class HadesContext(commands.Context["Hades"]):
                 ),
                 color=FlagsColorMapping.get("NEUTRAL", 000000)
             )
-            url: str = get_embed(embed)
+            with self.bot.metrics.timer("embed"):
+                url: str = await get_embed(embed)
+
             content: str = hidden(url)
 
         if not embed:
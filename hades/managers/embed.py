@@ -1,43 +1,53 @@
 from urllib.parse import quote, urlencode
+from collections import OrderedDict
+import asyncio
+import hashlib
+import sqlite3
+import threading
 import typing
 import json
 
-from curl_cffi.requests import Session
 from discord import Embed
 
-session: Session = Session(
-    impersonate="chrome119"
-)
+from .http import client as http
+
+API: str = "https://beta.embedl.ink/api/trpc/create.embed"
+HEADERS: typing.Dict[str, str] = {
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "content-type": "application/json",
+    "priority": "u=1, i",
+    "referer": "https://beta.embedl.ink/",
+    "sec-ch-ua-mobile": "?0",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "trpc-accept": "application/jsonl",
+    "x-trpc-source": "nextjs-react",
+}
 
 def rgb_to_hex(rgb: typing.Tuple[int, int, int]) -> str:
     return "#{:02x}{:02x}{:02x}".format(*rgb)
 
-def parse_response(response: str) -> typing.List[typing.Dict[str, typing.Any]]:
-    return [json.loads(part) for part in response.split('\n') if part.strip()]
+def parse_line(line: typing.Union[str, bytes]) -> typing.Optional[str]:
+    """
+    Pull the embed id out of one line of the tRPC JSONL stream, if that line carries the result.
+    """
+    try:
+        data = json.loads(line).get("json")
+        return str(data[2][0][0]["id"])
+    except (ValueError, AttributeError, LookupError, TypeError):
+        return None
 
-def get_embed(
+def build_payload(
     embed: Embed,
     provider: typing.Optional[str] = None,
     provider_url: typing.Optional[str] = None,
     video: typing.Optional[str] = None
-) -> str:
-    if embed.fields:
-        return  # Fields currently unsupported.
+) -> typing.Dict[str, typing.Any]:
+    media_type: str = "video" if video else ("thumbnail" if embed.thumbnail else "none")
 
-    params: typing.Dict[str, str] = {
-        "provider": provider if provider else "",
-        "author": embed.author.name if embed.author and embed.author.name else "",
-        "title": embed.title if embed.title else "",
-        "color": rgb_to_hex(embed.colour.to_rgb()) if embed.colour else "",
-        "media_type": "video" if video else ("thumbnail" if embed.thumbnail else "none"),
-        "desc": embed.description if embed.description else ""
-    }
-
-    if video:
-        params["media_type"] = "video"
-
-    
-    data: typing.Dict[str, typing.Any] = {
+    return {
         "0": {
             "json": {
                 key: value
@@ -47,9 +57,9 @@ def get_embed(
                     "author": embed.author.name if embed.author and embed.author.name else None,
                     "authorLink": embed.url if embed.url else None,
                     "title": embed.title if embed.title else None,
-                    "color": "#000000",
+                    "color": rgb_to_hex(embed.colour.to_rgb()) if embed.colour else "#000000",
                     "description": embed.description if embed.description else None,
-                    "mediaType": params.get("media_type"),
+                    "mediaType": media_type,
                     "mediaSource": embed.thumbnail.url if embed.thumbnail and embed.thumbnail.url else None
                 }.items()
                 if value is not None
@@ -57,37 +67,206 @@ def get_embed(
         }
     }
 
-    serialized: str = json.dumps(data)
-
-    res = session.get(
-        "https://beta.embedl.ink/api/trpc/create.embed",
-        headers={
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/json",
-            "priority": "u=1, i",
-            "referer": "https://beta.embedl.ink/",
-            "sec-ch-ua-mobile": "?0",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "trpc-accept": "application/jsonl",
-            "x-trpc-source": "nextjs-react",
-        },
-        params={
-            "batch": 1,
-            "input": data
-        }
-    ) 
+class EmbedCache:
+    """
+    Content-addressed store of generated embed links: an in-memory LRU in front of a SQLite file,
+    keyed by a hash of the normalized payload, so an embed that was built once is never requested again.
+    Memory hits are answered inline; SQLite reads and writes run in a worker thread, off the event loop.
+    """
+
+    def __init__(self, path: str = "embeds.db", size: int = 512) -> None:
+        self.path: str = path
+        self.size: int = size
+
+        self.memory: "OrderedDict[str, str]" = OrderedDict()
+        self._db: typing.Optional[sqlite3.Connection] = None
+        self._lock: threading.Lock = threading.Lock()
+
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key(payload: typing.Dict[str, typing.Any]) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS embeds (key TEXT PRIMARY KEY, url TEXT)")
+
+        return self._db
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses, "size": len(self.memory)}
+
+    def remember(self, key: str, url: str) -> None:
+        self.memory[key] = url
+        self.memory.move_to_end(key)
+
+        while len(self.memory) > self.size:
+            self.memory.popitem(last=False)
+
+    def recall(self, key: str) -> typing.Optional[str]:
+        if (url := self.memory.get(key)) is not None:
+            self.memory.move_to_end(key)
+            self.hits += 1
+
+        return url
+
+    def execute(
+        self,
+        query: str,
+        params: typing.Tuple[typing.Any, ...] = (),
+        commit: bool = False
+    ) -> typing.List[typing.Tuple[typing.Any, ...]]:
+        """
+        Run one query on the shared connection under its lock; blocking, so call it through `asyncio.to_thread`.
+        """
+        with self._lock:
+            rows = self.db.execute(query, params).fetchall()
+
+            if commit:
+                self.db.commit()
+
+        return rows
+
+    def read(self, key: str) -> typing.Optional[str]:
+        rows = self.execute("SELECT url FROM embeds WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    def write(self, key: str, url: str) -> None:
+        self.execute("INSERT OR REPLACE INTO embeds VALUES (?, ?)", (key, url), commit=True)
+
+    async def get(self, key: str) -> typing.Optional[str]:
+        if (url := self.recall(key)) is not None:
+            return url
+
+        if (url := await asyncio.to_thread(self.read, key)) is not None:
+            self.remember(key, url)
+            self.disk_hits += 1
+            return url
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, url: str) -> None:
+        self.remember(key, url)
+        await asyncio.to_thread(self.write, key, url)
 
-    _json: typing.List[typing.Dict[str, typing.Any]] = parse_response(res.text)
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
-    if not _json:
-        raise ValueError("Failed to parse JSON response")
+class EmbedClient:
+    """
+    Creates embed links without blocking the event loop.
+
+    Requests go through the shared HTTP client, time out and are retried with backoff, and concurrent
+    requests for an identical embed share a single upstream call. Links already generated are served
+    from the `EmbedCache` with no network I/O.
+    """
+
+    def __init__(self, timeout: float = 10, retries: int = 2, cache: typing.Optional[EmbedCache] = None) -> None:
+        self.timeout: float = timeout
+        self.retries: int = retries
+        self.cache: EmbedCache = cache or EmbedCache()
+
+        self.inflight: typing.Dict[str, asyncio.Future] = {}
+
+        # When set (see `hades.api.start.EmbedServer.mint`), links are minted locally instead of upstream.
+        # Local mints are content-addressed by the server itself, so they skip the `EmbedCache`.
+        self.local: typing.Optional[typing.Callable[[typing.Dict[str, typing.Any]], typing.Awaitable[str]]] = None
+
+    async def close(self) -> None:
+        self.cache.close()
+
+    async def create(self, payload: typing.Dict[str, typing.Any]) -> str:
+        if self.local is not None:
+            return await self.local(payload)
+
+        key: str = self.cache.key(payload)
+
+        if (url := self.cache.recall(key)) is not None:
+            return url
+
+        while (future := self.inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # This caller was cancelled, not the one making the request.
+
+            # The caller making the request was cancelled; the first follower to wake up takes over.
+
+        future = self.inflight[key] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        try:
+            # Registered as in flight first, so identical embeds share the disk lookup as well as the request.
+            if (url := await self.cache.get(key)) is None:
+                url = await self.request(payload)
+                await self.cache.put(key, url)
+
+            future.set_result(url)
+            return url
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            if self.inflight.get(key) is future:
+                del self.inflight[key]
+
+    async def request(self, payload: typing.Dict[str, typing.Any]) -> str:
+        error: Exception = ValueError("Failed to parse JSON response")
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
+            try:
+                async with http.stream(
+                    "GET",
+                    API,
+                    headers=HEADERS,
+                    params={"batch": 1, "input": json.dumps(payload)},
+                    timeout=self.timeout,
+                ) as response:
+                    async for line in response.aiter_lines():
+                        if line and (code := parse_line(line)):
+                            return f"https://beta.embedl.ink/e/{code}"
+
+                error = ValueError("Failed to parse JSON response")
+            except Exception as e:
+                error = e
+
+        raise error
+
+client: EmbedClient = EmbedClient()
+
+async def get_embed(
+    embed: Embed,
+    provider: typing.Optional[str] = None,
+    provider_url: typing.Optional[str] = None,
+    video: typing.Optional[str] = None
+) -> typing.Optional[str]:
+    if embed.fields:
+        return  # Fields currently unsupported.
 
-    code: int = _json[3]["json"][2][0][0].get("id")
+    return await client.create(build_payload(embed, provider, provider_url, video))
 
-    return f"https://beta.embedl.ink/e/{code}"
+async def prewarm(embeds: typing.Iterable[Embed]) -> None:
+    """
+    Generate (or load from disk) the links for `embeds` ahead of time so later sends skip the round trip.
+    """
+    await asyncio.gather(*(get_embed(embed) for embed in embeds), return_exceptions=True)
 
 def hidden(value: str) -> str:
     return (
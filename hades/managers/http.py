@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from curl_cffi.requests import AsyncSession, Response
+
+import asyncio
+import time
+
+if TYPE_CHECKING:
+    from .metrics import Metrics
+
+__all__: Tuple[str, ...] = ("HTTPClient", "client")
+
+OPTIONS: Tuple[str, ...] = ("impersonate", "timeout", "per_host", "max_clients")
+
+class HTTPClient:
+    """
+    The one HTTP client every module goes through: a single keep-alive `AsyncSession` (created on first use,
+    so importing costs nothing), a concurrency limit per host, a default timeout, and per-host request
+    timings recorded into `metrics` (`http:<host>`) while metrics are enabled.
+    """
+
+    def __init__(
+        self,
+        impersonate: str = "chrome119",
+        timeout: float = 10,
+        per_host: int = 8,
+        max_clients: int = 32
+    ) -> None:
+        self.impersonate: str = impersonate
+        self.timeout: float = timeout
+        self.per_host: int = per_host
+        self.max_clients: int = max_clients
+
+        self.metrics: Optional[Metrics] = None
+        self.requests: int = 0
+        self.errors: int = 0
+
+        self._session: Optional[AsyncSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+
+    def configure(self, **options: Any) -> None:
+        for key, value in options.items():
+            if key not in OPTIONS:
+                raise TypeError(f"Unknown HTTP option '{key}'.")
+
+            setattr(self, key, value)
+
+    @property
+    def session(self) -> AsyncSession:
+        # A pool left behind by a loop that has since closed (e.g. the updater's) can't be reused.
+        if self._session is None or self._loop is not asyncio.get_running_loop():
+            self._limits.clear()
+            self._loop = asyncio.get_running_loop()
+            self._session = AsyncSession(loop=self._loop, impersonate=self.impersonate, max_clients=self.max_clients)
+
+        return self._session
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "errors": self.errors, "hosts": len(self._limits)}
+
+    def limit(self, host: str) -> asyncio.Semaphore:
+        if (semaphore := self._limits.get(host)) is None:
+            semaphore = self._limits[host] = asyncio.Semaphore(self.per_host)
+
+        return semaphore
+
+    def record(self, host: str, start: float) -> None:
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.record(f"http:{host}", time.perf_counter() - start)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        session, host = self.session, urlsplit(url).netloc
+        kwargs.setdefault("timeout", self.timeout)
+
+        async with self.limit(host):
+            start = time.perf_counter()
+            self.requests += 1
+
+            try:
+                return await session.request(method, url, **kwargs)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.record(host, start)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[Response]:
+        session, host = self.session, urlsplit(url).netloc
+        kwargs.setdefault("timeout", self.timeout)
+
+        async with self.limit(host):
+            start = time.perf_counter()
+            self.requests += 1
+
+            try:
+                async with session.stream(method, url, **kwargs) as response:
+                    yield response
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.record(host, start)
+
+    async def get(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the pool; the next request opens a new one, so the client can outlive an event loop.
+        """
+        self._limits.clear()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = self._loop = None
+
+client: HTTPClient = HTTPClient()
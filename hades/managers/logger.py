@@ -1,17 +1,58 @@
 import logging
-from typing import Any
-from threading import Thread, Event
-from queue import Queue, Empty
+from typing import Any, Callable, Dict, List, Optional, Union
+from threading import Thread, Event, current_thread
+from queue import Queue, Empty, Full
 
 from loguru import logger as loguru_logger
+import atexit
+import json
+import os
 import sys
 
+POLICIES = ("block", "drop_oldest", "sample")
+Message = Union[str, Callable[[], str]]
+LEVELS = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+FIELDS = ("event", "command", "latency_ms", "guild_id", "channel_id")
+
+def should_colorize(stream: Any) -> bool:
+    # Loguru only auto-detects colour for stream sinks, and ours is a function that batches into stderr.
+    if "NO_COLOR" in os.environ:
+        return False
+
+    try:
+        return stream.isatty()
+    except Exception:
+        return False
+
 class HadesLogger:
+    """
+    Hands records to a worker thread through a bounded queue, so logging never blocks the event loop
+    (unless the `block` policy is chosen).
+
+    When the queue is full, `drop_oldest` discards the oldest queued record and `sample` keeps only one in
+    `sample_rate` records once the queue is half full. The worker drains up to `batch_size` records at a
+    time and writes them to stderr in one go.
+
+    Messages are formatted on the worker, and only if they pass the level check: pass brace-style args
+    (`logger.info("Loaded {}.", ext)`) or a callable (`logger.debug(lambda: ...)`) rather than an f-string.
+
+    With `file` enabled, records are also written as newline-delimited JSON to a rotated, compressed file.
+    Keyword args become fields of the record (`logger.debug("...", event="command", latency_ms=1.2)`).
+    """
+
     def __init__(
         self, 
-        max_size: int = 15, 
-        log_level: str = "INFO"
+        max_size: int = 10000, 
+        log_level: str = "INFO",
+        policy: str = "drop_oldest",
+        batch_size: int = 256,
+        sample_rate: int = 10,
+        file: Optional[Dict[str, Any]] = None,
+        colorize: Optional[bool] = None
     ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown log queue policy '{policy}', expected one of {', '.join(POLICIES)}.")
+
         self._format = (
             "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
             "<level>{level}</level> | "
@@ -19,12 +60,59 @@ class HadesLogger:
             "<level>{message}</level>"
         )
 
-        self._queue = Queue(maxsize=max_size)
+        self._queue: Queue = Queue(maxsize=max_size)
         self._log_level = log_level.upper()
+        self._levels: Dict[str, int] = {name: loguru_logger.level(name).no for name in LEVELS}
+        self._level_no: int = self._levels[self._log_level]
         self._stop_event = Event()
 
+        self.policy: str = policy
+        self.batch_size: int = batch_size
+        self.sample_rate: int = sample_rate
+
+        self.emitted: int = 0
+        self.dropped: int = 0
+        self.sampled: int = 0
+        self._seen: int = 0
+
+        self._buffer: List[str] = []
+
         self._worker_thread = Thread(target=self._process_queue, daemon=True)
+
+        # Replace loguru's stock stderr handler, which would print every record a second time; handlers added
+        # by anyone else are left alone, and only the ones added here are removed on shutdown.
+        try:
+            loguru_logger.remove(0)
+        except ValueError:
+            pass
+
+        self._handlers: List[int] = [
+            loguru_logger.add(
+                self._write,
+                format=self._format,
+                colorize=should_colorize(sys.stderr) if colorize is None else colorize,
+                level=self._log_level,
+            )
+        ]
+
+        self.file: Dict[str, Any] = file or {}
+
+        if self.file.get("enabled"):
+            file_level: str = self.file.get("level", "DEBUG").upper()
+
+            self._handlers.append(loguru_logger.add(
+                self.file.get("path", "logs/hades.ndjson"),
+                format=self._json_format,
+                level=file_level,
+                rotation=self.file.get("rotation", "20 MB"),
+                retention=self.file.get("retention", 10),
+                compression=self.file.get("compression", "gz"),
+                encoding="utf-8",
+            ))
+            self._level_no = min(self._level_no, self._levels[file_level])
+
         self._worker_thread.start()
+        atexit.register(self.shutdown)
 
         logging.getLogger("discord.voice_client").setLevel(logging.WARNING)
 
@@ -40,67 +128,177 @@ class HadesLogger:
 
     def _patch_logger(self, logger_name: str) -> None:
         class InterceptHandler(logging.Handler):
-            def __init__(self, log_level: str):
+            def __init__(self, level_no: int):
                 super().__init__()
-                self._log_level = log_level
+                self._level_no = level_no
 
             def emit(self, record: logging.LogRecord) -> None:
-                if logging.getLevelName(record.levelname) < logging.getLevelName(self._log_level):
+                if record.levelno < self._level_no:
                     return
 
                 loguru_logger.opt(depth=8, exception=record.exc_info).log(record.levelname, record.getMessage())
 
-        logging.getLogger(logger_name).handlers = [InterceptHandler(self._log_level)]  # type: ignore
+        logging.getLogger(logger_name).handlers = [InterceptHandler(self._level_no)]  # type: ignore
         logging.getLogger(logger_name).propagate = False
 
+    def enabled(self, level: str) -> bool:
+        return self._levels[level] >= self._level_no
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"queued": self._queue.qsize(), "emitted": self.emitted, "dropped": self.dropped, "sampled": self.sampled}
+
+    def _write(self, message: str) -> None:
+        # Records emitted by the worker are buffered and written once per batch; anything logged through
+        # loguru from another thread (the intercepted discord loggers) goes straight out.
+        if current_thread() is self._worker_thread:
+            self._buffer.append(message)
+        else:
+            sys.stderr.write(message)
+
+    @staticmethod
+    def _json_format(record: Dict[str, Any]) -> str:
+        extra: Dict[str, Any] = record["extra"]
+        data: Dict[str, Any] = {
+            "time": record["time"].isoformat(),
+            "level": record["level"].name,
+            "message": record["message"],
+            **{field: extra.get(field) for field in FIELDS},
+        }
+        data.update((key, value) for key, value in extra.items() if key not in data and not key.startswith("_"))
+
+        if record["exception"] is not None:
+            data["exception"] = repr(record["exception"].value)
+
+        extra["_json"] = json.dumps(data, default=str, ensure_ascii=False)
+        return "{extra[_json]}\n"
+
+    def _flush(self) -> None:
+        if self._buffer:
+            sys.stderr.write("".join(self._buffer))
+            sys.stderr.flush()
+            self._buffer.clear()
+
+    def _emit(self, record: Dict[str, Any]) -> None:
+        try:
+            msg = record["msg"]
+
+            if callable(msg):
+                msg = msg()
+
+            # Keyword args are record fields, bound into `extra` rather than used for formatting, so a message
+            # with literal braces can still carry them.
+            log = loguru_logger.bind(**record["kwargs"]) if record["kwargs"] else loguru_logger
+            log.opt(depth=record["depth"]).log(record["level"], msg, *record["args"])
+            self.emitted += 1
+        except Exception as e:
+            loguru_logger.error(f"Error in logging thread: {e}")
+
     def _process_queue(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                record = self._queue.get(timeout=0.1)
+        while True:
+            batch: List[Optional[Dict[str, Any]]] = [self._queue.get()]
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
 
+            for record in batch:
                 if record is None:
-                    return
+                    continue
+
+                self._emit(record)
+
+            self._flush()
+
+            if None in batch:
+                return
+
+    def _enqueue(self, record: Dict[str, Any]) -> None:
+        if self.policy == "block":
+            self._queue.put(record)
+            return
 
-                if (lvl := loguru_logger.level(record["level"]).no) >= loguru_logger.level(self._log_level).no:
-                    loguru_logger.opt(depth=record["depth"]).log(
-                        record["level"], record["msg"], *record["args"], **record["kwargs"]
-                    )
+        if self.policy == "sample" and self._queue.qsize() >= self._queue.maxsize // 2:
+            self._seen += 1
+
+            if self._seen % self.sample_rate:
+                self.sampled += 1
+                return
+
+        try:
+            self._queue.put_nowait(record)
+            return
+        except Full:
+            pass
+
+        if self.policy == "drop_oldest":
+            try:
+                self._queue.get_nowait()
             except Empty:
-                continue
-            except Exception as e:
-                loguru_logger.error(f"Error in logging thread: {e}")
+                pass
 
-    def _log(self, level: str, msg: str, *args: Any, **kwargs: Any) -> None:
-        if not self._queue.full():
-            if loguru_logger.level(level).no < loguru_logger.level(self._log_level).no:
+            try:
+                self._queue.put_nowait(record)
+                self.dropped += 1
                 return
+            except Full:
+                pass
 
-            self._queue.put({
-                "level": level, 
-                "msg": msg, 
-                "args": args, 
-                "kwargs": kwargs, 
-                "depth": kwargs.pop("depth", 1) + 1
-            })
+        self.dropped += 1
+
+    def _log(self, level: str, msg: Message, *args: Any, **kwargs: Any) -> None:
+        record = {
+            "level": level, 
+            "msg": msg, 
+            "args": args, 
+            "kwargs": kwargs, 
+            "depth": kwargs.pop("depth", 1) + 1
+        }
+
+        if self._stop_event.is_set():
+            self._emit(record)
         else:
-            loguru_logger.warning("Log queue is full. Dropping message.")
+            self._enqueue(record)
 
-    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._log("DEBUG", msg, *args, **kwargs)
+    def debug(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        if self._levels["DEBUG"] >= self._level_no:
+            self._log("DEBUG", msg, *args, **kwargs)
 
-    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._log("INFO", msg, *args, **kwargs)
+    def info(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        if self._levels["INFO"] >= self._level_no:
+            self._log("INFO", msg, *args, **kwargs)
 
-    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._log("WARNING", msg, *args, **kwargs)
+    def warning(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        if self._levels["WARNING"] >= self._level_no:
+            self._log("WARNING", msg, *args, **kwargs)
 
-    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._log("ERROR", msg, *args, **kwargs)
+    def error(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        if self._levels["ERROR"] >= self._level_no:
+            self._log("ERROR", msg, *args, **kwargs)
 
-    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._log("CRITICAL", msg, *args, **kwargs)
+    def critical(self, msg: Message, *args: Any, **kwargs: Any) -> None:
+        if self._levels["CRITICAL"] >= self._level_no:
+            self._log("CRITICAL", msg, *args, **kwargs)
 
     def shutdown(self) -> None:
+        """
+        Stop accepting queued records, wait for the worker to write everything already queued, then remove
+        the handlers this logger added.
+        """
+        if self._stop_event.is_set():
+            return
+
         self._stop_event.set()
         self._queue.put(None)
         self._worker_thread.join()
+
+        if self.dropped or self.sampled:
+            loguru_logger.warning(f"Log queue dropped {self.dropped} and sampled out {self.sampled} records.")
+
+        for handler in self._handlers:
+            try:
+                loguru_logger.remove(handler)
+            except ValueError:
+                pass
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple, Union
+from contextlib import nullcontext
+
+import time
+
+__all__: Tuple[str, ...] = ("Histogram", "Metrics")
+
+# Log-linear buckets, as in HdrHistogram: every power of two is split into 2 ** SUB_BITS linear
+# sub-buckets, so a recorded value is off by at most 1/16th, whatever its magnitude.
+SUB_BITS: int = 4
+SUB: int = 1 << SUB_BITS
+
+def bucket(value: int) -> int:
+    if value < SUB:
+        return value
+
+    shift = value.bit_length() - SUB_BITS - 1
+    return (shift + 1) * SUB + (value >> shift) - SUB
+
+def bucket_floor(index: int) -> int:
+    if index < SUB:
+        return index
+
+    return (index % SUB + SUB) << (index // SUB - 1)
+
+class Histogram:
+    """
+    Microsecond latencies in sparse log-linear buckets; percentiles are reported as bucket upper bounds.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    def record(self, micros: int) -> None:
+        index = bucket(micros)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += micros
+
+        if micros > self.max:
+            self.max = micros
+
+    def percentile(self, q: float) -> int:
+        target, seen = q / 100 * self.count, 0
+
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+
+            if seen >= target:
+                return min(bucket_floor(index + 1) - 1, self.max)
+
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count / 1000 if self.count else 0.0,
+            "p50": self.percentile(50) / 1000,
+            "p95": self.percentile(95) / 1000,
+            "p99": self.percentile(99) / 1000,
+            "max": self.max / 1000,
+        }
+
+class Timer:
+    __slots__ = ("metrics", "key", "start")
+
+    def __init__(self, metrics: Metrics, key: str) -> None:
+        self.metrics: Metrics = metrics
+        self.key: str = key
+
+    def __enter__(self) -> Timer:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.metrics.record(self.key, time.perf_counter() - self.start)
+
+_NULL: nullcontext = nullcontext()
+
+class Metrics:
+    """
+    Named latency histograms (`command:snipe`, `listener:Messages.deletes`, `rule:react`, `delete`, ...).
+
+    Everything is gated on `enabled`, which can be flipped at runtime: while off, `timer` hands back a shared
+    no-op context manager and no key is ever built.
+    """
+
+    def __init__(self, enabled: bool = False, log_interval: float = 0) -> None:
+        self.enabled: bool = enabled
+        self.log_interval: float = log_interval
+        self.histograms: Dict[str, Histogram] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        if (histogram := self.histograms.get(key)) is None:
+            histogram = self.histograms[key] = Histogram()
+
+        histogram.record(int(seconds * 1_000_000))
+
+    def timer(self, *key: str) -> Union[Timer, nullcontext]:
+        return Timer(self, ":".join(key)) if self.enabled else _NULL
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def summary(self) -> List[Tuple[str, Dict[str, float]]]:
+        """
+        Per-key summaries in milliseconds, busiest first.
+        """
+        return sorted(
+            ((key, histogram.summary()) for key, histogram in self.histograms.items()),
+            key=lambda item: item[1]["count"],
+            reverse=True,
+        )
@@ -0,0 +1,160 @@
+from typing import Any, Dict, Hashable, Optional, Tuple, Type, Union
+
+import asyncio
+import time
+
+__all__: Tuple[str, ...] = ("TokenBucket", "SlidingWindow", "RateLimiter")
+
+class TokenBucket:
+    """
+    Allows `amount` hits per `per` seconds, refilling continuously so bursts are smoothed out.
+    """
+
+    __slots__ = ("amount", "per", "tokens", "updated")
+
+    def __init__(self, amount: int, per: float, now: float) -> None:
+        self.amount: int = amount
+        self.per: float = per
+        self.tokens: float = amount
+        self.updated: float = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.amount, self.tokens + (now - self.updated) * self.amount / self.per)
+        self.updated = now
+
+    def peek(self, now: float) -> float:
+        self.refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) * self.per / self.amount
+
+    def hit(self, now: float) -> float:
+        if retry_after := self.peek(now):
+            return retry_after
+
+        self.tokens -= 1
+        return 0.0
+
+    def idle(self, now: float) -> bool:
+        return self.tokens + (now - self.updated) * self.amount / self.per >= self.amount
+
+class SlidingWindow:
+    """
+    Allows `amount` hits in any `per` second window, estimated from the current and previous fixed
+    windows so each check stays O(1) instead of keeping every timestamp.
+    """
+
+    __slots__ = ("amount", "per", "start", "current", "previous")
+
+    def __init__(self, amount: int, per: float, now: float) -> None:
+        self.amount: int = amount
+        self.per: float = per
+        self.start: float = now
+        self.current: int = 0
+        self.previous: int = 0
+
+    def roll(self, now: float) -> None:
+        elapsed = now - self.start
+
+        if elapsed >= self.per:
+            windows = int(elapsed // self.per)
+            self.previous = self.current if windows == 1 else 0
+            self.current = 0
+            self.start += windows * self.per
+
+    def peek(self, now: float) -> float:
+        self.roll(now)
+        weight = 1 - (now - self.start) / self.per
+
+        if self.previous * weight + self.current + 1 <= self.amount:
+            return 0.0
+
+        if self.previous and self.current + 1 <= self.amount:
+            return max(self.start + self.per * (1 - (self.amount - 1 - self.current) / self.previous) - now, 0.0)
+
+        return self.start + self.per - now
+
+    def hit(self, now: float) -> float:
+        if retry_after := self.peek(now):
+            return retry_after
+
+        self.current += 1
+        return 0.0
+
+    def idle(self, now: float) -> bool:
+        return now - self.start >= 2 * self.per
+
+Bucket = Union[TokenBucket, SlidingWindow]
+
+ALGORITHMS: Dict[str, Type[Any]] = {
+    "token_bucket": TokenBucket,
+    "sliding_window": SlidingWindow,
+}
+
+class RateLimiter:
+    """
+    A keyed rate limiter on the monotonic clock, independent of the cache's value store.
+
+    Each key gets its own bucket, created on first use with either the limiter's defaults or the
+    `amount`/`per` passed alongside it. Buckets that have fully recovered are swept every `sweep` seconds.
+    """
+
+    def __init__(
+        self,
+        amount: int = 1,
+        per: float = 60,
+        algorithm: str = "token_bucket",
+        sweep: float = 60
+    ) -> None:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm '{algorithm}'.")
+
+        self.amount: int = amount
+        self.per: float = per
+        self.algorithm: Type[Any] = ALGORITHMS[algorithm]
+
+        self.buckets: Dict[Hashable, Bucket] = {}
+        self.sweep_interval: float = sweep
+        self._swept: float = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def bucket(self, key: Hashable, amount: Optional[int] = None, per: Optional[float] = None) -> Bucket:
+        if (bucket := self.buckets.get(key)) is None:
+            now = time.monotonic()
+
+            # Sweep before inserting: a new bucket is full, so it would count as idle and be dropped.
+            if now - self._swept >= self.sweep_interval:
+                self.sweep(now)
+
+            bucket = self.buckets[key] = self.algorithm(amount or self.amount, per or self.per, now)
+
+        return bucket
+
+    def hit(self, key: Hashable, amount: Optional[int] = None, per: Optional[float] = None) -> float:
+        """
+        Count a hit against `key`, returning `0.0` if it was allowed or the seconds until it would be.
+        """
+        return self.bucket(key, amount, per).hit(time.monotonic())
+
+    def retry_after(self, key: Hashable) -> float:
+        return bucket.peek(time.monotonic()) if (bucket := self.buckets.get(key)) else 0.0
+
+    def is_ratelimited(self, key: Hashable) -> bool:
+        return self.retry_after(key) > 0
+
+    async def acquire(self, key: Hashable, amount: Optional[int] = None, per: Optional[float] = None) -> None:
+        """
+        Wait until a hit against `key` is allowed, then count it. Used to pace outbound requests.
+        """
+        while retry_after := self.hit(key, amount, per):
+            await asyncio.sleep(retry_after)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        now = now or time.monotonic()
+        idle = [key for key, bucket in self.buckets.items() if bucket.idle(now)]
+
+        for key in idle:
+            del self.buckets[key]
+
+        self._swept = now
+        return len(idle)
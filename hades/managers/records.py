@@ -0,0 +1,134 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from weakref import WeakValueDictionary
+
+from datetime import datetime, timezone
+
+import sys
+
+if TYPE_CHECKING:
+    from discord import Embed, Message
+
+__all__: Tuple[str, ...] = ("AuthorRecord", "GuildRecord", "ChannelRecord", "MessageRecord")
+
+class AuthorRecord:
+    __slots__ = ("id", "name", "bot", "avatar", "__weakref__")
+
+    def __init__(self, id: int, name: str, bot: bool, avatar: Optional[str]) -> None:
+        self.id: int = id
+        self.name: str = name
+        self.bot: bool = bot
+        self.avatar: Optional[str] = avatar
+
+    @property
+    def avatar_url(self) -> Optional[str]:
+        return f"https://cdn.discordapp.com/avatars/{self.id}/{self.avatar}.png" if self.avatar else None
+
+class GuildRecord:
+    __slots__ = ("id", "name", "__weakref__")
+
+    def __init__(self, id: int, name: str) -> None:
+        self.id: int = id
+        self.name: str = name
+
+class ChannelRecord:
+    __slots__ = ("id", "name", "__weakref__")
+
+    def __init__(self, id: int, name: Optional[str]) -> None:
+        self.id: int = id
+        self.name: Optional[str] = name
+
+# Records are shared between every snapshot that refers to them, and freed with the last one.
+_authors: "WeakValueDictionary[Tuple[Any, ...], AuthorRecord]" = WeakValueDictionary()
+_guilds: "WeakValueDictionary[Tuple[Any, ...], GuildRecord]" = WeakValueDictionary()
+_channels: "WeakValueDictionary[Tuple[Any, ...], ChannelRecord]" = WeakValueDictionary()
+
+def _intern(pool: WeakValueDictionary, cls: type, *fields: Any) -> Any:
+    if (record := pool.get(fields)) is None:
+        record = pool[fields] = cls(*fields)
+
+    return record
+
+class MessageRecord:
+    """
+    A compact snapshot of a deleted or edited message: raw ids and content captured at event time,
+    with author, guild and channel records interned. Anything derived is formatted when read.
+    """
+
+    __slots__ = ("id", "content", "created_at", "author", "guild", "channel", "attachments", "stickers", "embeds")
+
+    def __init__(
+        self,
+        id: int,
+        content: str,
+        created_at: float,
+        author: AuthorRecord,
+        guild: Optional[GuildRecord],
+        channel: ChannelRecord,
+        attachments: Tuple[str, ...] = (),
+        stickers: Tuple[str, ...] = (),
+        embeds: Tuple[Embed, ...] = ()
+    ) -> None:
+        self.id: int = id
+        self.content: str = content
+        self.created_at: float = created_at
+        self.author: AuthorRecord = author
+        self.guild: Optional[GuildRecord] = guild
+        self.channel: ChannelRecord = channel
+        self.attachments: Tuple[str, ...] = attachments
+        self.stickers: Tuple[str, ...] = stickers
+        self.embeds: Tuple[Embed, ...] = embeds
+
+    @classmethod
+    def from_message(cls, message: Message) -> MessageRecord:
+        author, guild, channel = message.author, message.guild, message.channel
+
+        return cls(
+            message.id,
+            message.content,
+            message.created_at.timestamp(),
+            _intern(_authors, AuthorRecord, author.id, author.name, author.bot, author.avatar.key if author.avatar else None),
+            _intern(_guilds, GuildRecord, guild.id, guild.name) if guild else None,
+            _intern(_channels, ChannelRecord, channel.id, getattr(channel, "name", None)),
+            tuple(attachment.url for attachment in message.attachments),
+            tuple(sticker.url for sticker in message.stickers),
+            tuple(message.embeds[:8]),
+        )
+
+    def __sizeof__(self) -> int:
+        # What `Namespace.max_bytes` should count: the record, its content, URLs and embed text. Interned
+        # author/guild/channel records are shared with other snapshots, so they're left out.
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.content)
+            + sys.getsizeof(self.attachments) + sum(sys.getsizeof(url) for url in self.attachments)
+            + sys.getsizeof(self.stickers) + sum(sys.getsizeof(url) for url in self.stickers)
+            + sys.getsizeof(self.embeds) + sum(sys.getsizeof(embed) + len(embed) for embed in self.embeds)
+        )
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at, tz=timezone.utc)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        The nested dict shape the old `Hades.dump` produced, built on demand.
+        """
+        return {
+            "guild": {"id": self.guild.id, "name": self.guild.name} if self.guild else None,
+            "channel": {"id": self.channel.id, "name": self.channel.name} if self.channel.name else {"id": self.channel.id, "type": "DM"},
+            "author": {
+                "name": self.author.name,
+                "id": self.author.id,
+                "bot": self.author.bot,
+                "avatar": self.author.avatar_url,
+            },
+            "attachments": list(self.attachments) + [
+                embed.thumbnail.url if embed.thumbnail else embed.image.url for embed in self.embeds if embed.type == "image"
+            ],
+            "stickers": list(self.stickers),
+            "embeds": [embed.to_dict() for embed in self.embeds if embed.type not in ("image", "video")],
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "id": self.id,
+        }
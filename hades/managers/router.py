@@ -0,0 +1,137 @@
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, TYPE_CHECKING
+
+import asyncio
+
+if TYPE_CHECKING:
+    from discord import Message
+    from .logger import HadesLogger
+    from .metrics import Metrics
+
+Handler = Callable[["Message"], Awaitable[Any]]
+Matcher = Callable[["Message"], Any]
+
+__all__: Tuple[str, ...] = ("MessageRouter",)
+
+class MessageRouter:
+    """
+    A single `on_message` dispatcher for per-message rules (auto-reply, auto-react, insult, ...).
+
+    Rules are registered by name and indexed by the author and channel ids they currently apply to,
+    so a message from anyone without a rule costs one dict lookup per index. Rules that look at every
+    message (the snipers) are enabled globally instead, with a synchronous `match` prefilter so a
+    message they don't care about never creates a coroutine. Matched rules run as background tasks
+    and never hold up command processing.
+    """
+
+    def __init__(self, logger: Optional[HadesLogger] = None, metrics: Optional[Metrics] = None) -> None:
+        self.logger: Optional[HadesLogger] = logger
+        self.metrics: Optional[Metrics] = metrics
+
+        self.handlers: Dict[str, Handler] = {}
+        self.matchers: Dict[str, Matcher] = {}
+        self.tasks: Set[asyncio.Task] = set()
+        self.authors: Dict[int, Set[str]] = {}
+        self.channels: Dict[int, Set[str]] = {}
+        self.always: Set[str] = set()
+
+    def register(
+        self,
+        name: str,
+        handler: Handler,
+        *,
+        authors: Iterable[int] = (),
+        channels: Iterable[int] = (),
+        always: bool = False,
+        match: Optional[Matcher] = None
+    ) -> None:
+        self.handlers[name] = handler
+
+        if match is not None:
+            self.matchers[name] = match
+
+        for author in authors:
+            self.watch(name, author=author)
+
+        for channel in channels:
+            self.watch(name, channel=channel)
+
+        if always:
+            self.enable(name)
+
+    def unregister(self, name: str) -> None:
+        self.handlers.pop(name, None)
+        self.matchers.pop(name, None)
+        self.always.discard(name)
+
+        for index in (self.authors, self.channels):
+            for key in [key for key, names in index.items() if name in names]:
+                self._discard(index, key, name)
+
+    def watch(self, name: str, *, author: Optional[int] = None, channel: Optional[int] = None) -> None:
+        if author is not None:
+            self.authors.setdefault(author, set()).add(name)
+
+        if channel is not None:
+            self.channels.setdefault(channel, set()).add(name)
+
+    def unwatch(self, name: str, *, author: Optional[int] = None, channel: Optional[int] = None) -> None:
+        if author is not None:
+            self._discard(self.authors, author, name)
+
+        if channel is not None:
+            self._discard(self.channels, channel, name)
+
+    def enable(self, name: str) -> None:
+        self.always.add(name)
+
+    def disable(self, name: str) -> None:
+        self.always.discard(name)
+
+    def toggle(self, name: str, enabled: bool) -> None:
+        (self.enable if enabled else self.disable)(name)
+
+    @staticmethod
+    def _discard(index: Dict[int, Set[str]], key: int, name: str) -> None:
+        if (names := index.get(key)) is not None:
+            names.discard(name)
+
+            if not names:
+                del index[key]
+
+    def rules(self, message: Message) -> Set[str]:
+        names = self.always
+
+        if (by_author := self.authors.get(message.author.id)) is not None:
+            names = names | by_author
+
+        if (by_channel := self.channels.get(message.channel.id)) is not None:
+            names = names | by_channel
+
+        return names
+
+    def dispatch(self, message: Message) -> None:
+        if not (names := self.rules(message)):
+            return
+
+        for name in names:
+            if (handler := self.handlers.get(name)) is None:
+                continue
+
+            if (match := self.matchers.get(name)) is not None and not match(message):
+                continue
+
+            task = asyncio.create_task(self.run(name, handler, message))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def run(self, name: str, handler: Handler, message: Message) -> None:
+        try:
+            if self.metrics is not None and self.metrics.enabled:
+                with self.metrics.timer("rule", name):
+                    await handler(message)
+            else:
+                await handler(message)
+        except Exception as e:
+            if self.logger:
+                self.logger.error("Message rule {} failed. | {}", name, e)
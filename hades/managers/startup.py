@@ -0,0 +1,150 @@
+"""
+Startup tracing: wall-clock phases from process start to the first gateway connect, and, with `--trace`
+(or `HADES_TRACE=1`), per-module import times in the spirit of `python -X importtime`.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+
+import os
+import sys
+import time
+
+if TYPE_CHECKING:
+    from .logger import HadesLogger
+
+__all__: Tuple[str, ...] = ("StartupTrace", "trace")
+
+class TimedLoader(Loader):
+    """
+    Stands in for one spec's loader and times its `exec_module`, so shared loaders (the builtin and frozen
+    importer classes) are never patched. The real loader is put back on the module before its code runs.
+    """
+
+    def __init__(self, timer: ImportTimer, name: str, loader: Loader) -> None:
+        self.timer: ImportTimer = timer
+        self.name: str = name
+        self.loader: Loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> Any:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self.loader
+
+        module.__loader__ = self.loader
+
+        if not self.timer.installed:
+            return self.loader.exec_module(module)
+
+        start = time.perf_counter()
+        self.timer.stack.append(0.0)
+
+        try:
+            self.loader.exec_module(module)
+        finally:
+            children = self.timer.stack.pop()
+            elapsed = time.perf_counter() - start
+            self.timer.times[self.name] = [elapsed, elapsed - children]
+
+            if self.timer.stack:
+                self.timer.stack[-1] += elapsed
+
+class ImportTimer(MetaPathFinder):
+    """
+    Times every module imported while installed, recording inclusive and self time.
+    """
+
+    def __init__(self) -> None:
+        self.times: Dict[str, List[float]] = {}
+        self.stack: List[float] = []
+        self.installed: bool = False
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+        self.installed = True
+
+    def uninstall(self) -> None:
+        self.installed = False
+
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name: str, path: Optional[Sequence[str]], target: Any = None) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            if (spec := finder.find_spec(name, path, target)) is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = TimedLoader(self, name, spec.loader)
+
+        return spec
+
+class StartupTrace:
+    def __init__(self) -> None:
+        self.start: float = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.imports: Optional[ImportTimer] = None
+        self.reported: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.imports is not None
+
+    def install(self, argv: Sequence[str] = ()) -> None:
+        """
+        Start timing imports if `--trace` is in `argv` or `HADES_TRACE` is set; call before importing the bot.
+        """
+        if self.imports is None and ("--trace" in argv or os.environ.get("HADES_TRACE")):
+            self.imports = ImportTimer()
+            self.imports.install()
+
+    def mark(self, name: str) -> None:
+        """
+        End the phase called `name` now; phases are measured from the previous mark.
+        """
+        self.marks.append((name, time.perf_counter()))
+
+    def phases(self) -> List[Tuple[str, float]]:
+        previous, phases = self.start, []
+
+        for name, at in self.marks:
+            phases.append((name, (at - previous) * 1000))
+            previous = at
+
+        return phases
+
+    def report(self, logger: HadesLogger, limit: int = 15) -> None:
+        if self.reported:
+            return
+
+        self.reported = True
+        total = ((self.marks[-1][1] if self.marks else time.perf_counter()) - self.start) * 1000
+
+        logger.info(
+            "Startup | {:.0f}ms to first gateway connect ({}).",
+            total, ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.phases()),
+            event="startup", latency_ms=round(total, 3),
+        )
+
+        if self.imports is None:
+            return
+
+        self.imports.uninstall()
+
+        for name, (cumulative, own) in sorted(self.imports.times.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+            logger.info("Startup | import {} {:.1f}ms (self {:.1f}ms)", name, cumulative * 1000, own * 1000)
+
+        self.imports = None
+
+trace: StartupTrace = StartupTrace()
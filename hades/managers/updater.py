@@ -1,8 +1,10 @@
 from pathlib import Path
 from typing import Union, List, Dict, Any
 
+from .http import client as http
+
+import asyncio
 import os
-import requests
 import sys
 
 class Updater:
@@ -15,51 +17,70 @@ class Updater:
         self.current = float(current_version) if '.' in str(current_version) else int(current_version)
 
     @staticmethod
-    def latest() -> float:
-        return float(requests.get(Updater.UPDATE).json().get("version"))
+    async def manifest() -> Dict[str, Any]:
+        return (await http.get(Updater.UPDATE)).json()
+
+    @staticmethod
+    async def latest() -> float:
+        return float((await Updater.manifest()).get("version"))
 
     @staticmethod
-    def fetch(repo_url: str) -> List[Dict[str, Any]]:
-        return requests.get(repo_url).json()
+    async def fetch(repo_url: str) -> List[Dict[str, Any]]:
+        return (await http.get(repo_url)).json()
 
     @staticmethod
-    def download(url: str, path: Path) -> None:
-        response = requests.get(url)
+    async def download(url: str, path: Path) -> None:
+        response = await http.get(url)
         response.raise_for_status()
         path.write_bytes(response.content)
 
-    def has_update(self) -> bool:
-        return (latest := self.latest()) > self.current
+    async def has_update(self) -> bool:
+        return (latest := await self.latest()) > self.current
 
-    def replace_files(self, repo_files: List[Dict[str, Any]], base_path: Path = Path(".")) -> None:
-        update_config = requests.get(self.UPDATE).json().get("update_config", False)
+    async def replace_files(self, repo_files: List[Dict[str, Any]], base_path: Path = Path(".")) -> None:
+        update_config = (await self.manifest()).get("update_config", False)
         print("[HADES UPDATER] The config will be updated! (reset)") if update_config else None
 
-        [
-            self.process_file(file_info, base_path, update_config) 
-            for file_info in repo_files 
+        await asyncio.gather(*(
+            self.process_file(file_info, base_path, update_config)
+            for file_info in repo_files
             if file_info["name"] not in self.TO_IGNORE
-        ]
+        ))
 
-    def process_file(self, file_info: Dict[str, Any], base_path: Path, update_config: bool) -> None:
+    async def process_file(self, file_info: Dict[str, Any], base_path: Path, update_config: bool) -> None:
         path = base_path / file_info["path"]
 
         if file_info["type"] == "file" and (file_info["name"] != "config.json" or update_config):
-            self.download(f'{self.RAW}{file_info["path"]}', path)
-            
+            await self.download(f'{self.RAW}{file_info["path"]}', path)
+
         elif file_info["type"] == "dir":
             path.mkdir(parents=True, exist_ok=True)
-            self.replace_files(self.fetch(file_info["_links"]["self"]), base_path)
+            await self.replace_files(await self.fetch(file_info["_links"]["self"]), base_path)
 
     def restart(self) -> None:
         os.execv(sys.executable, ["python"] + sys.argv)
 
-    def run(self) -> None:
-        if self.has_update():
+    async def check(self) -> bool:
+        if await self.has_update():
             print("[HADES UPDATER] An update is available. Updating...")
-            self.replace_files(self.fetch(self.REPO))
+            await self.replace_files(await self.fetch(self.REPO))
             print("[HADES UPDATER] Update completed. Restarting application...")
-            self.current = self.latest()
+            self.current = await self.latest()
+            return True
+
+        print("[HADES UPDATER] No update available.")
+        return False
+
+    async def check_once(self) -> bool:
+        try:
+            return await self.check()
+        finally:
+            # The pool belongs to this short-lived loop; the bot opens its own on first use.
+            await http.close()
+
+    def run(self) -> None:
+        """
+        Check synchronously, outside the bot; `Hades(updater=...)` checks in the background instead.
+        """
+        if asyncio.run(self.check_once()):
             self.restart()
-        else:
-            print("[HADES UPDATER] No update available.")
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from typing import AsyncIterator, Dict, Iterable, Set, Tuple
+from pathlib import Path
+
+import asyncio
+
+try:
+    from watchfiles import awatch
+except ImportError:  # Optional: fall back to polling mtimes.
+    awatch = None
+
+__all__: Tuple[str, ...] = ("FileWatcher",)
+
+class FileWatcher:
+    """
+    Yields batches of changed paths under `paths` (directories are watched for `*.py` files), using
+    inotify through `watchfiles` when it is installed and polling `os.stat` every `interval` seconds otherwise.
+    """
+
+    def __init__(self, paths: Iterable[str], interval: float = 1.0, polling: bool = False) -> None:
+        self.paths: Tuple[Path, ...] = tuple(Path(path).resolve() for path in paths)
+        self.interval: float = interval
+        self.polling: bool = polling or awatch is None
+        self.stop_event: asyncio.Event = asyncio.Event()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def wanted(self, path: Path) -> bool:
+        return path in self.paths or (path.suffix == ".py" and any(parent in self.paths for parent in path.parents))
+
+    def scan(self) -> Dict[Path, int]:
+        mtimes: Dict[Path, int] = {}
+
+        for root in self.paths:
+            for path in root.rglob("*.py") if root.is_dir() else (root,):
+                try:
+                    mtimes[path] = path.stat().st_mtime_ns
+                except FileNotFoundError:
+                    pass
+
+        return mtimes
+
+    async def notify(self) -> AsyncIterator[Set[Path]]:
+        # Files are watched through their directory, so editors that save by replacing the file keep being
+        # seen; only watched directories are recursive.
+        roots: Dict[Path, bool] = {}
+
+        for path in self.paths:
+            if path.is_dir():
+                roots[path] = True
+            else:
+                roots.setdefault(path.parent, False)
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def pump(root: Path, recursive: bool) -> None:
+            try:
+                async for batch in awatch(
+                    root,
+                    watch_filter=lambda _, path: self.wanted(Path(path)),
+                    stop_event=self.stop_event,
+                    recursive=recursive,
+                ):
+                    queue.put_nowait({Path(path) for _, path in batch})
+            finally:
+                queue.put_nowait(None)
+
+        tasks = [asyncio.create_task(pump(root, recursive)) for root, recursive in roots.items()]
+        finished = 0
+
+        try:
+            while finished < len(tasks):
+                if (batch := await queue.get()) is None:
+                    finished += 1
+                else:
+                    yield batch
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def changes(self) -> AsyncIterator[Set[Path]]:
+        if not self.polling:
+            async for batch in self.notify():
+                yield batch
+
+            return
+
+        previous: Dict[Path, int] = self.scan()
+
+        while not self.stop_event.is_set():
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), self.interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            current = await asyncio.to_thread(self.scan)
+            changed = {path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path)}
+            previous = current
+
+            if changed:
+                yield changed
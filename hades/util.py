@@ -2,28 +2,20 @@
 A quick util package for Hades.
 """
 from __future__ import annotations
-from typing import Dict, Optional, Union, Literal, ClassVar
+from typing import Dict, Optional, Union, ClassVar
 
 import base64
 import hashlib
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import unpad
 
-from curl_cffi.requests import Session
-from bs4 import BeautifulSoup
-
 from .constants import HEADERS
+from .managers.http import client as http
 
-import subprocess
-
-session: Session = Session(
-    impersonate="chrome119",
-    headers={
-        "User-Agent": "Mozilla/5.0 (Linux i582 x86_64) AppleWebKit/535.47 (KHTML, like Gecko) Chrome/119.0.1621.282 Safari/537",
-        "X-Requested-With": "XMLHttpRequest"
-    },
-    cookies={}
-)
+PRIVNOTE_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Linux i582 x86_64) AppleWebKit/535.47 (KHTML, like Gecko) Chrome/119.0.1621.282 Safari/537",
+    **HEADERS,
+}
 
 
 class PrivnoteDec:
@@ -81,11 +73,11 @@ def parse_password(value: str) -> Optional[bytearray]:
         return bytearray(password_str, encoding="utf-8") if password_str else None
 
 
-def read_note(url: str) -> str:
+async def read_note(url: str) -> str:
     """
     A function for reading and destroying privnotes, utilizing `curl_cffi` to bypass Cloudflare.
     """
-    response = session.delete(url, headers=HEADERS)
+    response = await http.delete(url, headers=PRIVNOTE_HEADERS)
     password = parse_password(url)
 
     data, decryptor = response.json().get(